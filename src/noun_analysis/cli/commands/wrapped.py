@@ -6,6 +6,7 @@ from collections import Counter
 from pathlib import Path
 
 import click
+import orjson
 
 from noun_analysis.wrapped import WrappedData, WrappedRenderer
 from noun_analysis.wrapped.speaker_export import SpeakerExporter
@@ -13,6 +14,11 @@ from noun_analysis.wrapped.speaker_export import SpeakerExporter
 from ..constants import console
 
 
+def _write_json(path: Path, data) -> None:
+    """Write data as indented UTF-8 JSON (same layout as json.dumps(indent=2))."""
+    path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
+
 @click.command()
 @click.argument("data_dir", type=click.Path(exists=True), required=False, default="./data_wp21")
 @click.option("--results-dir", "-r", type=click.Path(exists=True), default="./results_wp21", help="Results directory")
@@ -71,7 +77,7 @@ def export_web(data_dir: str, results_dir: str, output: str):
     web_data = data.to_web_json()
     output_path = Path(output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(web_data, ensure_ascii=False, indent=2))
+    output_path.write_bytes(data.to_web_json_bytes(web_data))
 
     console.print(f"\n[green]Exported to {output}[/]")
     console.print(f"  Parties: {len(web_data['parties'])}")
@@ -189,7 +195,7 @@ def export_speeches(data_dir: str, output: str):
     # Write output
     output_path = Path(output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(output_data, ensure_ascii=False, indent=2))
+    _write_json(output_path, output_data)
 
     console.print(f"\n[green]Exported to {output}[/]")
     console.print(f"  Speeches: {len(speeches)}")
@@ -261,7 +267,7 @@ def export_interruptions(data_dir: str, results_dir: str, output: str):
         ],
     }
     interrupters_file = output_path / "zwischenrufer.json"
-    interrupters_file.write_text(json.dumps(interrupters_data, ensure_ascii=False, indent=2))
+    _write_json(interrupters_file, interrupters_data)
     console.print(f"  [green]✓[/] {interrupters_file} ({len(interrupters)} entries: {total_positive} positiv, {total_negative} negativ, {total_neutral} neutral)")
 
     # Export all interrupted (who gets interrupted)
@@ -276,7 +282,7 @@ def export_interruptions(data_dir: str, results_dir: str, output: str):
         ],
     }
     interrupted_file = output_path / "interrupted.json"
-    interrupted_file.write_text(json.dumps(interrupted_data, ensure_ascii=False, indent=2))
+    _write_json(interrupted_file, interrupted_data)
     console.print(f"  [green]✓[/] {interrupted_file} ({len(interrupted)} entries)")
 
     console.print(f"\n[green]Exported interruption data![/]")
@@ -314,7 +320,7 @@ def export_neutral_texts(data_dir: str, results_dir: str, output: str):
 
     output_path = Path(output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(output_data, ensure_ascii=False, indent=2))
+    _write_json(output_path, output_data)
 
     console.print(f"  [green]✓[/] {output_path} ({len(neutral_texts)} total, {len(text_counts)} unique)")
 
@@ -352,7 +358,7 @@ def export_all(data_dir: str, results_dir: str, output_dir: str, skip_speeches:
     console.print("\n[cyan]1/5[/cyan] Exporting wrapped.json...")
     web_data = data.to_web_json()
     wrapped_path = output_path / "wrapped.json"
-    wrapped_path.write_text(json.dumps(web_data, ensure_ascii=False, indent=2))
+    wrapped_path.write_bytes(data.to_web_json_bytes(web_data))
     console.print(f"  [green]✓[/] {wrapped_path}")
 
     # 2. Export individual speaker profiles (uses optimized SpeakerExporter)
@@ -393,7 +399,7 @@ def export_all(data_dir: str, results_dir: str, output_dir: str, skip_speeches:
             for i, (n, p, c) in enumerate(interrupters)
         ],
     }
-    (output_path / "zwischenrufer.json").write_text(json.dumps(interrupters_data, ensure_ascii=False, indent=2))
+    _write_json(output_path / "zwischenrufer.json", interrupters_data)
 
     # Interrupted
     interrupted = data.get_most_interrupted(1000)
@@ -403,7 +409,7 @@ def export_all(data_dir: str, results_dir: str, output_dir: str, skip_speeches:
         "count": len(interrupted),
         "data": [{"rank": i + 1, "name": n, "party": p, "count": c} for i, (n, p, c) in enumerate(interrupted)],
     }
-    (output_path / "interrupted.json").write_text(json.dumps(interrupted_data, ensure_ascii=False, indent=2))
+    _write_json(output_path / "interrupted.json", interrupted_data)
     console.print(f"  [green]✓[/] zwischenrufer.json ({len(interrupters)} entries)")
     console.print(f"  [green]✓[/] interrupted.json ({len(interrupted)} entries)")
 
@@ -418,7 +424,7 @@ def export_all(data_dir: str, results_dir: str, output_dir: str, skip_speeches:
         "uniqueCount": len(text_counts),
         "data": [{"text": text, "count": count} for text, count in text_counts.most_common()],
     }
-    (output_path / "neutral_interjections.json").write_text(json.dumps(neutral_data, ensure_ascii=False, indent=2))
+    _write_json(output_path / "neutral_interjections.json", neutral_data)
     console.print(f"  [green]✓[/] neutral_interjections.json ({len(text_counts)} unique)")
 
     # 5. Export speech databases (optional - large files)
@@ -443,7 +449,7 @@ def export_all(data_dir: str, results_dir: str, output_dir: str, skip_speeches:
                     })
 
             output_data = {"count": len(speeches), "speeches": speeches}
-            (output_path / "speeches_db.json").write_text(json.dumps(output_data, ensure_ascii=False, indent=2))
+            _write_json(output_path / "speeches_db.json", output_data)
             console.print(f"  [green]✓[/] speeches_db.json ({len(speeches)} speeches)")
         else:
             console.print(f"  [yellow]⚠[/] speeches.json not found, skipping")
@@ -7,6 +7,7 @@ Useful for analyzing large amounts of parliamentary speech text.
 import asyncio
 import json
 import os
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
@@ -57,17 +58,7 @@ class GeminiClient:
         """
         model = model or self.DEFAULT_MODEL
         url = f"{self.BASE_URL}/models/{model}:generateContent?key={self.api_key}"
-
-        request_body: dict[str, Any] = {
-            "contents": [{"parts": [{"text": prompt}]}],
-            "generationConfig": {
-                "temperature": 0.1,  # Low temp for structured output
-                "maxOutputTokens": 65536,  # Max for Gemini 2.5 Flash
-            },
-        }
-
-        if system_instruction:
-            request_body["systemInstruction"] = {"parts": [{"text": system_instruction}]}
+        request_body = self._request_body(prompt, system_instruction)
 
         for attempt in range(max_retries):
             try:
@@ -101,6 +92,79 @@ class GeminiClient:
 
         return ""
 
+    async def generate_stream(
+        self,
+        prompt: str,
+        model: str | None = None,
+        system_instruction: str | None = None,
+        max_retries: int = 3,
+    ) -> AsyncIterator[str]:
+        """Generate text from prompt, yielding response chunks as they arrive.
+
+        Uses the server-sent events endpoint, so long generations don't sit
+        on one idle read and the response envelope is never decoded as a
+        whole. Retries only happen before the first chunk is received.
+
+        Args:
+            prompt: The user prompt/input text
+            model: Model ID (default: gemini-2.5-flash)
+            system_instruction: Optional system instruction
+            max_retries: Number of retries for transient errors
+
+        Yields:
+            Text chunks of the generated response
+        """
+        model = model or self.DEFAULT_MODEL
+        url = f"{self.BASE_URL}/models/{model}:streamGenerateContent?alt=sse&key={self.api_key}"
+        request_body = self._request_body(prompt, system_instruction)
+        received = False
+
+        for attempt in range(max_retries):
+            try:
+                async with self._client.stream(
+                    "POST",
+                    url,
+                    json=request_body,
+                    headers={"Content-Type": "application/json"},
+                ) as response:
+                    if response.status_code == 429:
+                        await asyncio.sleep(2 ** attempt)
+                        continue
+
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = json.loads(line[5:].strip())
+                        for candidate in data.get("candidates", [])[:1]:
+                            for part in candidate.get("content", {}).get("parts", []):
+                                text = part.get("text", "")
+                                if text:
+                                    received = True
+                                    yield text
+                    return
+
+            except (httpx.ReadError, httpx.ConnectError, httpx.TimeoutException):
+                # A retry after partial output would duplicate chunks
+                if received or attempt == max_retries - 1:
+                    raise
+                await asyncio.sleep(2 ** attempt)
+
+    def _request_body(self, prompt: str, system_instruction: str | None) -> dict[str, Any]:
+        """Build the generateContent request body."""
+        request_body: dict[str, Any] = {
+            "contents": [{"parts": [{"text": prompt}]}],
+            "generationConfig": {
+                "temperature": 0.1,  # Low temp for structured output
+                "maxOutputTokens": 65536,  # Max for Gemini 2.5 Flash
+            },
+        }
+
+        if system_instruction:
+            request_body["systemInstruction"] = {"parts": [{"text": system_instruction}]}
+
+        return request_body
+
     async def analyze_text(
         self,
         text: str,
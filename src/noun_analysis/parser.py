@@ -61,10 +61,10 @@ def parse_speeches_from_protocol(text: str) -> list[dict]:
     # Detect Q&A session boundaries for proper classification
     qa_session_ranges = find_qa_session_ranges(text)
 
-    speeches = []
+    speeches: list[dict] = []
 
     # Find all boundaries (all types)
-    boundaries = []
+    boundaries: list[dict] = []
 
     # Regular speakers with party: "Name (Party):"
     for m in SPEAKER_PATTERN.finditer(text):
@@ -112,6 +112,8 @@ def parse_speeches_from_protocol(text: str) -> list[dict]:
     boundaries.sort(key=lambda x: x['start'])
 
     # Extract speech text between boundaries
+    n_boundaries = len(boundaries)
+    text_len = len(text)
     for i, boundary in enumerate(boundaries):
         # Skip president speeches - we only use them as boundaries
         if boundary['is_president']:
@@ -121,10 +123,10 @@ def parse_speeches_from_protocol(text: str) -> list[dict]:
         text_start = boundary['end']
 
         # Text ends at start of next boundary (or end of document)
-        if i + 1 < len(boundaries):
+        if i + 1 < n_boundaries:
             text_end = boundaries[i + 1]['start']
         else:
-            text_end = len(text)
+            text_end = text_len
 
         speech_text = text[text_start:text_end].strip()
 
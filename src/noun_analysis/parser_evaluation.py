@@ -8,17 +8,32 @@ Compares regex-based parsing with Gemini extraction to identify:
 """
 
 import asyncio
-import json
+import hashlib
+import logging
 import re
+from collections import defaultdict
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 from pathlib import Path
 from typing import Literal
 
+import numpy as np
+import orjson
+
 from .gemini_service import GeminiClient
 from .parser import parse_speeches_from_protocol
 from .storage import DataStore
 
+logger = logging.getLogger(__name__)
+
+try:
+    from rapidfuzz import fuzz, process
+    from rapidfuzz.distance import Levenshtein
+except ImportError:  # Optional: pip install bundestag-analysis[eval]
+    fuzz = None
+    process = None
+    Levenshtein = None
+
 
 @dataclass
 class GeminiSpeech:
@@ -100,9 +115,11 @@ SYSTEM_INSTRUCTION = """You are an expert parser of German Bundestag Plenarproto
 Your task is to identify and extract all speeches from the protocol text.
 Output as a JSON array. Be thorough - do not miss any speeches."""
 
-EXTRACTION_PROMPT = """Analyze this German Bundestag Plenarprotokoll and extract ALL speeches.
+BATCH_SYSTEM_INSTRUCTION = """You are an expert parser of German Bundestag Plenarprotokolle (parliamentary protocols).
+Your task is to identify and extract all speeches from each protocol text.
+Output as a JSON object mapping the number after PROTOCOL in each section header to a JSON array of its speeches. Be thorough - do not miss any speeches."""
 
-For each speech, provide:
+_SPEECH_FIELDS = """For each speech, provide:
 - speaker: Full name as written (e.g., "Dr. Alice Weidel", "Friedrich Merz")
 - party: Party in parentheses if present (e.g., "CDU/CSU", "SPD"), or null for government officials
 - role: Government role if applicable (e.g., "Bundeskanzler", "Bundesminister der Finanzen"), or null
@@ -118,7 +135,11 @@ INCLUDE:
 EXCLUDE:
 - Presiding officers' procedural remarks (Präsident/in, Vizepräsident/in)
 - Table of contents entries at the beginning
-- Headers and section titles
+- Headers and section titles"""
+
+EXTRACTION_PROMPT = """Analyze this German Bundestag Plenarprotokoll and extract ALL speeches.
+
+""" + _SPEECH_FIELDS + """
 
 Return ONLY valid JSON array, no markdown formatting, no explanation.
 
@@ -127,13 +148,37 @@ Protocol text (may be truncated):
 {protocol_text}
 ---"""
 
+BATCH_EXTRACTION_PROMPT = """Analyze each of these German Bundestag Plenarprotokolle and extract ALL speeches.
+Each protocol starts with a header line "=== PROTOCOL <number> ===".
+
+""" + _SPEECH_FIELDS + """
+
+Return ONLY a valid JSON object whose keys are the numbers after PROTOCOL in the header
+lines (as strings, e.g. "0", "1") and whose values are the JSON arrays of speeches of those
+protocols, no markdown formatting, no explanation. Do not use protocol ids or session
+numbers from the texts as keys.
+
+Protocol texts (may be truncated):
+---
+{protocols}
+---"""
+
+GEMINI_MODEL = "gemini-2.5-flash"
+
+# ~4 chars per token, 1M tokens for pro, 128K for flash
+MAX_PROTOCOL_CHARS = 400_000  # Safe limit for flash
+
+
+_TITLE_RE = re.compile(r"\b(Dr\.?|Prof\.?)\s*")
+_CODE_FENCE_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```")
+
 
 def normalize_name(name: str) -> str:
     """Normalize speaker name for comparison."""
     if not name:
         return ""
     # Remove academic titles
-    name = re.sub(r"\b(Dr\.?|Prof\.?)\s*", "", name)
+    name = _TITLE_RE.sub("", name)
     # Remove extra whitespace
     name = " ".join(name.split())
     return name.lower().strip()
@@ -152,53 +197,226 @@ def normalize_party_for_compare(party: str | None) -> str:
     return party
 
 
-def text_similarity(text1: str, text2: str) -> float:
-    """Calculate text similarity ratio."""
-    if not text1 or not text2:
-        return 0.0
-    return SequenceMatcher(None, text1[:200].lower(), text2[:200].lower()).ratio()
+def similarity_ratio(text1: str, text2: str, score_cutoff: float = 0.0) -> float:
+    """Similarity ratio in [0, 1]; returns 0.0 if below score_cutoff.
+
+    Uses rapidfuzz when installed (which can bail out early once the
+    cutoff is unreachable), difflib otherwise.
+    """
+    if fuzz is not None:
+        return fuzz.ratio(text1, text2, score_cutoff=score_cutoff * 100) / 100
+    ratio = SequenceMatcher(None, text1, text2).ratio()
+    return ratio if ratio >= score_cutoff else 0.0
+
+
+def similarity_matrix(
+    texts1: list[str], texts2: list[str], score_cutoff: float = 0.0
+) -> np.ndarray:
+    """Pairwise similarity_ratio() of two text lists as a (len1, len2) array."""
+    if not texts1 or not texts2:
+        return np.zeros((len(texts1), len(texts2)))
+    if process is not None:
+        # One batched, multi-threaded call instead of len1 × len2 Python calls
+        scores = process.cdist(
+            texts1, texts2, scorer=fuzz.ratio, score_cutoff=score_cutoff * 100, workers=-1
+        )
+        return scores / 100
+    return np.array(
+        [[similarity_ratio(t1, t2, score_cutoff) for t2 in texts2] for t1 in texts1]
+    )
+
 
+def levenshtein_distance(s1: str, s2: str, max_distance: int = 3) -> int:
+    """Calculate Levenshtein distance between two strings, bounded.
 
-def levenshtein_distance(s1: str, s2: str) -> int:
-    """Calculate Levenshtein distance between two strings."""
+    Pure-Python fallback used when rapidfuzz is not installed. After
+    trimming the common prefix and suffix, only the diagonal band of
+    width ``max_distance`` is filled, and the scan stops as soon as a
+    whole row exceeds the bound. Distances above ``max_distance`` are
+    reported as ``max_distance + 1``.
+    """
     if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
-    if len(s2) == 0:
+        s1, s2 = s2, s1
+
+    # Common prefix and suffix never contribute edits; trimming them
+    # shrinks the DP (names often share first name or ending)
+    prefix = 0
+    limit = len(s2)
+    while prefix < limit and s1[prefix] == s2[prefix]:
+        prefix += 1
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and s1[-1 - suffix] == s2[-1 - suffix]:
+        suffix += 1
+    if prefix or suffix:
+        s1 = s1[prefix:len(s1) - suffix]
+        s2 = s2[prefix:len(s2) - suffix]
+
+    n = len(s2)
+    cap = max_distance + 1
+    if len(s1) - n > max_distance:
+        return cap
+    if n == 0:
         return len(s1)
 
-    previous_row = range(len(s2) + 1)
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
+    previous_row = [cap] * (n + 1)
+    for j in range(min(n, max_distance) + 1):
+        previous_row[j] = j
+
+    for i, c1 in enumerate(s1, 1):
+        current_row = [cap] * (n + 1)
+        if i <= max_distance:
+            current_row[0] = i
+        row_min = current_row[0]
+        lo = i - max_distance if i > max_distance else 1
+        hi = i + max_distance if i + max_distance < n else n
+        for j in range(lo, hi + 1):
+            cost = previous_row[j - 1] + (c1 != s2[j - 1])
+            insertion = previous_row[j] + 1
+            if insertion < cost:
+                cost = insertion
+            deletion = current_row[j - 1] + 1
+            if deletion < cost:
+                cost = deletion
+            if cost > cap:
+                cost = cap
+            current_row[j] = cost
+            if cost < row_min:
+                row_min = cost
+        if row_min > max_distance:
+            return cap
         previous_row = current_row
 
-    return previous_row[-1]
+    return previous_row[n]
+
+
+def _bounded_distance(s1: str, s2: str, threshold: int) -> int:
+    """Levenshtein distance, capped just above threshold."""
+    # rapidfuzz aborts once the cutoff is exceeded
+    if Levenshtein is not None:
+        return Levenshtein.distance(s1, s2, score_cutoff=threshold)
+    return levenshtein_distance(s1, s2, threshold)
 
 
 def fuzzy_name_match(name1: str, name2: str, threshold: int = 3) -> bool:
     """Check if two names match (fuzzy)."""
-    n1 = normalize_name(name1)
-    n2 = normalize_name(name2)
+    return _normalized_names_match(normalize_name(name1), normalize_name(name2), threshold)
+
 
+def _normalized_names_match(n1: str, n2: str, threshold: int = 3) -> bool:
+    """Fuzzy match for names already passed through normalize_name()."""
     # Exact match
     if n1 == n2:
         return True
 
-    # Levenshtein distance
-    if levenshtein_distance(n1, n2) <= threshold:
+    # Last name match (plain string compare, no DP needed)
+    last1 = _last_name(n1)
+    if last1 and last1 == _last_name(n2):
         return True
 
-    # Last name match
-    parts1 = n1.split()
-    parts2 = n2.split()
-    if parts1 and parts2 and parts1[-1] == parts2[-1]:
-        return True
+    # Length difference alone already exceeds the edit budget
+    if abs(len(n1) - len(n2)) > threshold:
+        return False
 
-    return False
+    # Levenshtein distance
+    return _bounded_distance(n1, n2, threshold) <= threshold
+
+
+def _request_fingerprint(
+    model: str, system_instruction: str, prompt: str, protocol_text: str
+) -> str:
+    """Short hash identifying the Gemini request that extracted a protocol."""
+    request = "\0".join((model, system_instruction, prompt, protocol_text))
+    return hashlib.blake2b(request.encode(), digest_size=16).hexdigest()
+
+
+def _truncate_protocol(full_text: str) -> str:
+    """Truncate protocol text to what fits into one Gemini request."""
+    if len(full_text) <= MAX_PROTOCOL_CHARS:
+        return full_text
+    return full_text[:MAX_PROTOCOL_CHARS] + "\n\n[TEXT TRUNCATED]"
+
+
+def _pack_batches(items: list[tuple], max_chars: int) -> list[list[tuple]]:
+    """Greedily group (protocol_id, text, ...) items into batches of at most max_chars text.
+
+    An item larger than max_chars forms a batch of its own.
+    """
+    batches: list[list[tuple]] = []
+    current: list[tuple] = []
+    size = 0
+    for item in items:
+        length = len(item[1])
+        if current and size + length > max_chars:
+            batches.append(current)
+            current, size = [], 0
+        current.append(item)
+        size += length
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _decode_json_payload(response: str, open_char: str, close_char: str):
+    """Decode JSON from a model response, tolerating code fences and chatter.
+
+    Returns None if no JSON value delimited by open_char/close_char is found.
+    """
+    # Try direct JSON parse
+    try:
+        return orjson.loads(response)
+    except orjson.JSONDecodeError:
+        pass
+
+    # Try extracting from markdown code block
+    if "```" in response:
+        json_match = _CODE_FENCE_RE.search(response)
+        if json_match:
+            try:
+                return orjson.loads(json_match.group(1))
+            except orjson.JSONDecodeError:
+                pass
+
+    # Try the outermost delimited value in the response
+    start = response.find(open_char)
+    end = response.rfind(close_char)
+    if 0 <= start < end:
+        try:
+            return orjson.loads(response[start:end + 1])
+        except orjson.JSONDecodeError:
+            pass
+
+    return None
+
+
+def _to_gemini_speeches(speeches_data: list[dict]) -> list[GeminiSpeech]:
+    """Convert raw Gemini speech dicts to GeminiSpeech objects with error handling."""
+    speeches = []
+    for s in speeches_data:
+        try:
+            # Ensure required fields have defaults
+            speech = GeminiSpeech(
+                speaker=s.get("speaker", "Unknown"),
+                party=s.get("party"),
+                role=s.get("role"),
+                text_preview=s.get("text_preview", ""),
+                start_marker=s.get("start_marker", ""),
+                speech_type=s.get("speech_type", "unknown"),
+                zwischenrufe=s.get("zwischenrufe", []) if isinstance(s.get("zwischenrufe"), list) else [],
+            )
+            speeches.append(speech)
+        except Exception:
+            # Skip malformed entries
+            continue
+    skipped = len(speeches_data) - len(speeches)
+    if skipped:
+        logger.warning("Skipped %d malformed speech entries in Gemini response", skipped)
+    return speeches
+
+
+def _last_name(normalized_name: str) -> str:
+    """Last token of a name already passed through normalize_name()."""
+    return normalized_name.rpartition(" ")[2]
 
 
 class ParserEvaluator:
@@ -214,86 +432,159 @@ class ParserEvaluator:
         self, full_text: str, protocol_id: str
     ) -> list[GeminiSpeech]:
         """Extract speeches using Gemini."""
-        # Check cache first
-        if self.cache_dir:
-            cache_file = self.cache_dir / f"{protocol_id}_gemini.json"
-            if cache_file.exists():
-                try:
-                    data = json.loads(cache_file.read_text())
-                    return [GeminiSpeech(**s) for s in data]
-                except (json.JSONDecodeError, TypeError):
-                    pass
-
-        # Truncate text if too long (Gemini has token limits)
-        # ~4 chars per token, 1M tokens for pro, 128K for flash
-        max_chars = 400_000  # Safe limit for flash
-        truncated = full_text[:max_chars]
-        if len(full_text) > max_chars:
-            truncated += "\n\n[TEXT TRUNCATED]"
+        results = await self.extract_batch([(protocol_id, full_text)])
+        return results[0]
 
-        # Use string concatenation to avoid format issues with curly braces in protocol text
-        prompt = EXTRACTION_PROMPT.replace("{protocol_text}", truncated)
+    async def extract_batch(
+        self,
+        items: list[tuple[str, str]],
+        max_batch_chars: int = 300_000,
+        max_concurrency: int = 8,
+    ) -> list[list[GeminiSpeech]]:
+        """Extract speeches for several protocols in as few requests as fit.
+
+        Args:
+            items: (protocol_id, full_text) pairs; ids need not be unique
+            max_batch_chars: Protocol text budget per request; small protocols
+                are packed together, larger ones are sent on their own
+            max_concurrency: Maximum number of Gemini requests in flight
+
+        Returns:
+            Speeches for each item, in input order
+
+        Responses are cached per protocol under a hash of the model, the
+        prompt that produced them and the (truncated) protocol text, so
+        prompt changes never return stale results.
+        """
+        results: dict[int, list[GeminiSpeech]] = {}
+        pending: list[tuple[str, str, int]] = []
 
-        response = await self.gemini.generate(
-            prompt=prompt,
-            system_instruction=SYSTEM_INSTRUCTION,
-            model="gemini-2.5-flash",
+        # Check cache first
+        for index, (protocol_id, full_text) in enumerate(items):
+            truncated = _truncate_protocol(full_text)
+            cached = self._load_cached(self._cache_file(protocol_id, truncated, batched=False))
+            if cached is None:
+                cached = self._load_cached(self._cache_file(protocol_id, truncated, batched=True))
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append((protocol_id, truncated, index))
+
+        # Bound concurrent Gemini requests to stay within rate limits
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(batch: list[tuple[str, str, int]]) -> dict[int, list[GeminiSpeech]]:
+            async with semaphore:
+                return await self._extract_uncached(batch)
+
+        batches = _pack_batches(pending, max_batch_chars)
+        for batch_results in await asyncio.gather(*(run(batch) for batch in batches)):
+            results.update(batch_results)
+
+        return [results[index] for index in range(len(items))]
+
+    async def _extract_uncached(
+        self, batch: list[tuple[str, str, int]]
+    ) -> dict[int, list[GeminiSpeech]]:
+        """Send one Gemini request for a batch of (protocol_id, text, input index) items.
+
+        Protocols the batch answer leaves out (or all of them, if it can't be
+        parsed) are requested again one at a time with the single-protocol prompt.
+        """
+        if len(batch) == 1:
+            protocol_id, truncated, index = batch[0]
+            return {index: await self._extract_single(protocol_id, truncated)}
+
+        # Sections are labelled by input index, since protocol ids may repeat
+        sections = "\n\n".join(
+            f"=== PROTOCOL {index} ===\n{truncated}" for _, truncated, index in batch
         )
-
-        # Parse JSON response
-        speeches_data = self._parse_gemini_response(response)
-
-        # Cache the result
-        if self.cache_dir:
-            cache_file = self.cache_dir / f"{protocol_id}_gemini.json"
-            cache_file.write_text(json.dumps(speeches_data, ensure_ascii=False, indent=2))
-
-        # Convert to GeminiSpeech objects with error handling
-        speeches = []
-        for s in speeches_data:
-            try:
-                # Ensure required fields have defaults
-                speech = GeminiSpeech(
-                    speaker=s.get("speaker", "Unknown"),
-                    party=s.get("party"),
-                    role=s.get("role"),
-                    text_preview=s.get("text_preview", ""),
-                    start_marker=s.get("start_marker", ""),
-                    speech_type=s.get("speech_type", "unknown"),
-                    zwischenrufe=s.get("zwischenrufe", []) if isinstance(s.get("zwischenrufe"), list) else [],
-                )
-                speeches.append(speech)
-            except Exception:
-                # Skip malformed entries
+        prompt = BATCH_EXTRACTION_PROMPT.replace("{protocols}", sections)
+        response = await self._generate(prompt, BATCH_SYSTEM_INSTRUCTION)
+        data_by_label = self._parse_gemini_batch_response(response)
+
+        results: dict[int, list[GeminiSpeech]] = {}
+        for protocol_id, truncated, index in batch:
+            speeches_data = data_by_label.get(str(index))
+            if speeches_data is None:
+                results[index] = await self._extract_single(protocol_id, truncated)
                 continue
-        return speeches
+            self._write_cached(self._cache_file(protocol_id, truncated, batched=True), speeches_data)
+            results[index] = _to_gemini_speeches(speeches_data)
+        return results
 
-    def _parse_gemini_response(self, response: str) -> list[dict]:
-        """Parse Gemini's JSON response with error handling."""
-        # Try direct JSON parse
+    async def _extract_single(self, protocol_id: str, truncated: str) -> list[GeminiSpeech]:
+        """Send one Gemini request for a single protocol and cache the result."""
+        # Use string concatenation to avoid format issues with curly braces in protocol text
+        prompt = EXTRACTION_PROMPT.replace("{protocol_text}", truncated)
+        response = await self._generate(prompt, SYSTEM_INSTRUCTION)
+        speeches_data = self._parse_gemini_response(response)
+        if speeches_data is None:
+            # Not cached, so the next run asks again
+            logger.warning("Could not parse Gemini response for protocol %s", protocol_id)
+            return []
+        self._write_cached(self._cache_file(protocol_id, truncated, batched=False), speeches_data)
+        return _to_gemini_speeches(speeches_data)
+
+    async def _generate(self, prompt: str, system_instruction: str) -> str:
+        """Run a streamed Gemini request and return the full response text.
+
+        Output is capped at 65k tokens, so the chunks are simply joined and
+        parsed once.
+        """
+        chunks = [
+            chunk
+            async for chunk in self.gemini.generate_stream(
+                prompt=prompt,
+                system_instruction=system_instruction,
+                model=GEMINI_MODEL,
+            )
+        ]
+        return "".join(chunks)
+
+    def _cache_file(self, protocol_id: str, truncated: str, batched: bool) -> Path | None:
+        """Cache path for a protocol's Gemini extraction, or None without cache.
+
+        batched selects the prompt the entry is keyed on, so editing one
+        prompt leaves entries produced by the other valid.
+        """
+        if not self.cache_dir:
+            return None
+        if batched:
+            key = _request_fingerprint(
+                GEMINI_MODEL, BATCH_SYSTEM_INSTRUCTION, BATCH_EXTRACTION_PROMPT, truncated
+            )
+        else:
+            key = _request_fingerprint(GEMINI_MODEL, SYSTEM_INSTRUCTION, EXTRACTION_PROMPT, truncated)
+        return self.cache_dir / f"{protocol_id}_{key}.json"
+
+    def _load_cached(self, cache_file: Path | None) -> list[GeminiSpeech] | None:
+        """Load cached speeches, or None on a cache miss."""
+        if not cache_file or not cache_file.exists():
+            return None
         try:
-            return json.loads(response)
-        except json.JSONDecodeError:
-            pass
-
-        # Try extracting from markdown code block
-        json_match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", response)
-        if json_match:
-            try:
-                return json.loads(json_match.group(1))
-            except json.JSONDecodeError:
-                pass
-
-        # Try finding array in response
-        array_match = re.search(r"\[[\s\S]*\]", response)
-        if array_match:
-            try:
-                return json.loads(array_match.group(0))
-            except json.JSONDecodeError:
-                pass
-
-        # Return empty if all parsing fails
-        return []
+            data = orjson.loads(cache_file.read_bytes())
+        except orjson.JSONDecodeError:
+            return None
+        return _to_gemini_speeches(data) if isinstance(data, list) else None
+
+    def _write_cached(self, cache_file: Path | None, speeches_data: list[dict]) -> None:
+        """Store raw speech dicts for a protocol, if caching is enabled."""
+        if cache_file:
+            cache_file.write_bytes(orjson.dumps(speeches_data))
+
+    def _parse_gemini_response(self, response: str) -> list[dict] | None:
+        """Parse Gemini's JSON array response, or None if it can't be parsed."""
+        data = _decode_json_payload(response, "[", "]")
+        return data if isinstance(data, list) else None
+
+    def _parse_gemini_batch_response(self, response: str) -> dict[str, list[dict]]:
+        """Parse a batched response into {section label: speeches}."""
+        data = _decode_json_payload(response, "{", "}")
+        if not isinstance(data, dict):
+            logger.warning("Could not parse batched Gemini response, retrying protocols one by one")
+            return {}
+        return {str(key): value for key, value in data.items() if isinstance(value, list)}
 
     def match_speeches(
         self,
@@ -302,89 +593,125 @@ class ParserEvaluator:
     ) -> list[SpeechMatch]:
         """Match Gemini-extracted speeches with regex-extracted speeches."""
         matches: list[SpeechMatch] = []
-        used_regex: set[int] = set()
-        used_gemini: set[int] = set()
+        used_gemini = np.zeros(len(gemini_speeches), dtype=bool)
+        used_regex = np.zeros(len(regex_speeches), dtype=bool)
+
+        # Normalize names and parties once instead of per pair
+        g_names = [normalize_name(g.speaker) for g in gemini_speeches]
+        g_parties = [normalize_party_for_compare(g.party) for g in gemini_speeches]
+        r_names = [normalize_name(r.get("speaker", "")) for r in regex_speeches]
+        r_parties = [normalize_party_for_compare(r.get("party")) for r in regex_speeches]
+
+        # Index regex speeches by last name to bound the pass 1 scan
+        r_by_last_name: dict[str, list[int]] = defaultdict(list)
+        for ri, name in enumerate(r_names):
+            r_by_last_name[_last_name(name)].append(ri)
 
         # Pass 1: Exact speaker + party match
         for gi, g in enumerate(gemini_speeches):
-            if gi in used_gemini:
-                continue
-            for ri, r in enumerate(regex_speeches):
-                if ri in used_regex:
-                    continue
-                if fuzzy_name_match(g.speaker, r.get("speaker", "")):
-                    g_party = normalize_party_for_compare(g.party)
-                    r_party = normalize_party_for_compare(r.get("party"))
-                    # Party match or government official (no party)
-                    if g_party == r_party or (g.role and not g.party):
-                        issues = []
-                        if g_party != r_party and g_party and r_party:
-                            issues.append(f"party mismatch: {g.party} vs {r.get('party')}")
-                        matches.append(
-                            SpeechMatch(
-                                gemini_speech=g,
-                                regex_speech=r,
-                                match_type="exact",
-                                issues=issues,
-                            )
-                        )
-                        used_regex.add(ri)
-                        used_gemini.add(gi)
+            g_name = g_names[gi]
+            g_party = g_parties[gi]
+            # Government officials (role, no party) match any party
+            any_party = bool(g.role and not g.party)
+            g_last = _last_name(g_name)
+
+            # The first unused regex speech (in protocol order) whose party
+            # and name match wins. A shared last name always matches, so the
+            # earliest such speech bounds the scan: only speeches before it
+            # can still win, via whole-name edit distance.
+            limit = len(regex_speeches)
+            if g_last:
+                for ri in r_by_last_name.get(g_last, ()):
+                    if not used_regex[ri] and (any_party or r_parties[ri] == g_party):
+                        limit = ri
                         break
+            match = limit if limit < len(regex_speeches) else None
+            for ri in np.flatnonzero(~used_regex[:limit]).tolist():
+                # Party check first: a plain string compare
+                if g_party != r_parties[ri] and not any_party:
+                    continue
+                if _normalized_names_match(g_name, r_names[ri]):
+                    match = ri
+                    break
+            if match is None:
+                continue
+
+            r = regex_speeches[match]
+            r_party = r_parties[match]
+            issues = []
+            if g_party != r_party and g_party and r_party:
+                issues.append(f"party mismatch: {g.party} vs {r.get('party')}")
+            matches.append(
+                SpeechMatch(
+                    gemini_speech=g,
+                    regex_speech=r,
+                    match_type="exact",
+                    issues=issues,
+                )
+            )
+            used_regex[match] = True
+            used_gemini[gi] = True
 
         # Pass 2: Fuzzy text match for remaining
-        for gi, g in enumerate(gemini_speeches):
-            if gi in used_gemini:
+        g_remaining = np.flatnonzero(~used_gemini)
+        r_remaining = np.flatnonzero(~used_regex)
+        g_previews = [gemini_speeches[gi].text_preview[:200].lower() for gi in g_remaining]
+        r_previews = [regex_speeches[ri].get("text", "")[:200].lower() for ri in r_remaining]
+        similarities = similarity_matrix(g_previews, r_previews, score_cutoff=0.5)
+        # Empty texts never match
+        similarities[np.array([not t for t in g_previews], dtype=bool), :] = 0.0
+        similarities[:, np.array([not t for t in r_previews], dtype=bool)] = 0.0
+
+        for row, gi in enumerate(g_remaining.tolist()):
+            if not len(r_remaining):
+                break
+            # First best-scoring regex speech not yet taken
+            row_scores = np.where(used_regex[r_remaining], 0.0, similarities[row])
+            col = int(row_scores.argmax())
+            best_sim = float(row_scores[col])
+            if best_sim <= 0.5:
                 continue
-            best_match = None
-            best_sim = 0.0
-            for ri, r in enumerate(regex_speeches):
-                if ri in used_regex:
-                    continue
-                sim = text_similarity(g.text_preview, r.get("text", "")[:200])
-                if sim > 0.5 and sim > best_sim:
-                    best_sim = sim
-                    best_match = (ri, r)
-
-            if best_match:
-                ri, r = best_match
-                issues = [f"matched by text similarity ({best_sim:.0%})"]
-                if not fuzzy_name_match(g.speaker, r.get("speaker", "")):
-                    issues.append(f"speaker mismatch: {g.speaker} vs {r.get('speaker')}")
-                matches.append(
-                    SpeechMatch(
-                        gemini_speech=g,
-                        regex_speech=r,
-                        match_type="partial",
-                        issues=issues,
-                    )
+
+            g = gemini_speeches[gi]
+            ri = int(r_remaining[col])
+            r = regex_speeches[ri]
+            issues = [f"matched by text similarity ({best_sim:.0%})"]
+            if not _normalized_names_match(g_names[gi], r_names[ri]):
+                issues.append(f"speaker mismatch: {g.speaker} vs {r.get('speaker')}")
+            matches.append(
+                SpeechMatch(
+                    gemini_speech=g,
+                    regex_speech=r,
+                    match_type="partial",
+                    issues=issues,
                 )
-                used_regex.add(ri)
-                used_gemini.add(gi)
+            )
+            used_regex[ri] = True
+            used_gemini[gi] = True
 
         # Remaining unmatched from Gemini (missed by regex)
-        for gi, g in enumerate(gemini_speeches):
-            if gi not in used_gemini:
-                matches.append(
-                    SpeechMatch(
-                        gemini_speech=g,
-                        regex_speech=None,
-                        match_type="gemini_only",
-                        issues=[f"MISSED: {g.speaker} ({g.party or g.role})"],
-                    )
+        for gi in np.flatnonzero(~used_gemini).tolist():
+            g = gemini_speeches[gi]
+            matches.append(
+                SpeechMatch(
+                    gemini_speech=g,
+                    regex_speech=None,
+                    match_type="gemini_only",
+                    issues=[f"MISSED: {g.speaker} ({g.party or g.role})"],
                 )
+            )
 
         # Remaining unmatched from regex (false positives or Gemini missed)
-        for ri, r in enumerate(regex_speeches):
-            if ri not in used_regex:
-                matches.append(
-                    SpeechMatch(
-                        gemini_speech=None,
-                        regex_speech=r,
-                        match_type="regex_only",
-                        issues=[f"REGEX ONLY: {r.get('speaker')} ({r.get('party')})"],
-                    )
+        for ri in np.flatnonzero(~used_regex).tolist():
+            r = regex_speeches[ri]
+            matches.append(
+                SpeechMatch(
+                    gemini_speech=None,
+                    regex_speech=r,
+                    match_type="regex_only",
+                    issues=[f"REGEX ONLY: {r.get('speaker')} ({r.get('party')})"],
                 )
+            )
 
         return matches
 
@@ -393,17 +720,24 @@ class ParserEvaluator:
     ) -> list[tuple[dict, dict, float]]:
         """Find potential duplicates (same speech extracted twice)."""
         duplicates: list[tuple[dict, dict, float]] = []
+        names = [normalize_name(s.get("speaker", "")) for s in speeches]
+        texts = [s.get("text", "")[:500] for s in speeches]
+
+        if process is not None:
+            # Score all pairs in one batched call, then check names only
+            # for the (few) pairs with near-identical text
+            similarities = similarity_matrix(texts, texts, score_cutoff=0.85)
+            for i, j in np.argwhere(np.triu(similarities > 0.85, k=1)).tolist():
+                if _normalized_names_match(names[i], names[j]):
+                    duplicates.append((speeches[i], speeches[j], float(similarities[i, j])))
+            return duplicates
 
         for i, s1 in enumerate(speeches):
             for j, s2 in enumerate(speeches[i + 1 :], i + 1):
                 # Same speaker
-                if fuzzy_name_match(
-                    s1.get("speaker", ""), s2.get("speaker", "")
-                ):
+                if _normalized_names_match(names[i], names[j]):
                     # Check text similarity
-                    text1 = s1.get("text", "")[:500]
-                    text2 = s2.get("text", "")[:500]
-                    sim = SequenceMatcher(None, text1, text2).ratio()
+                    sim = similarity_ratio(texts[i], texts[j], score_cutoff=0.85)
                     if sim > 0.85:
                         duplicates.append((s1, s2, sim))
 
@@ -414,13 +748,19 @@ class ParserEvaluator:
         protocol_id: str,
         full_text: str,
         document_number: str = "",
+        gemini_speeches: list[GeminiSpeech] | None = None,
     ) -> EvaluationResult:
-        """Evaluate parser accuracy for a single protocol."""
+        """Evaluate parser accuracy for a single protocol.
+
+        Pass gemini_speeches when they were already extracted (e.g. by
+        extract_batch) to skip the Gemini request.
+        """
         # Run regex parser
         regex_speeches = parse_speeches_from_protocol(full_text)
 
         # Run Gemini extraction
-        gemini_speeches = await self.extract_speeches_with_gemini(full_text, protocol_id)
+        if gemini_speeches is None:
+            gemini_speeches = await self.extract_speeches_with_gemini(full_text, protocol_id)
 
         # Match speeches
         matches = self.match_speeches(gemini_speeches, regex_speeches)
@@ -464,8 +804,14 @@ async def evaluate_protocols(
     sample_size: int = 3,
     protocol_id: int | None = None,
     cache_dir: Path | None = None,
+    max_concurrency: int = 8,
 ) -> list[EvaluationResult]:
-    """Evaluate parser on multiple protocols."""
+    """Evaluate parser on multiple protocols.
+
+    Gemini extraction is batched across protocols and runs concurrently,
+    with at most max_concurrency requests in flight. Results keep the
+    protocol order.
+    """
     store = DataStore(data_dir)
     protocols = store.get_downloaded_protocols()
 
@@ -483,18 +829,27 @@ async def evaluate_protocols(
         if len(protocols) > sample_size:
             protocols = random.sample(protocols, sample_size)
 
-    results: list[EvaluationResult] = []
+    items = [
+        (
+            str(protocol.get("data", {}).get("id", "unknown")),
+            protocol.get("fullText", ""),
+            protocol.get("data", {}).get("dokumentnummer", ""),
+        )
+        for protocol in protocols
+    ]
 
     async with GeminiClient() as client:
         evaluator = ParserEvaluator(client, cache_dir=cache_dir)
 
-        for protocol in protocols:
-            data = protocol.get("data", {})
-            full_text = protocol.get("fullText", "")
-            pid = str(data.get("id", "unknown"))
-            doc_num = data.get("dokumentnummer", "")
-
-            result = await evaluator.evaluate_protocol(pid, full_text, doc_num)
-            results.append(result)
+        # Extract all protocols up front so small ones share requests
+        gemini_results = await evaluator.extract_batch(
+            [(pid, full_text) for pid, full_text, _ in items],
+            max_concurrency=max_concurrency,
+        )
 
-    return results
+        return [
+            await evaluator.evaluate_protocol(
+                pid, full_text, doc_num, gemini_speeches=gemini_speeches
+            )
+            for (pid, full_text, doc_num), gemini_speeches in zip(items, gemini_results)
+        ]
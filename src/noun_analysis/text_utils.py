@@ -17,6 +17,28 @@ ACADEMIC_TITLES = [
     "Baron", "Freiherr", "Freifrau", "Prinz", "Graf",
     "h", "c",  # for "h.c." (honoris causa)
 ]
+_ACADEMIC_TITLES = frozenset(ACADEMIC_TITLES)
+
+
+# Single-character substitutions applied by clean_text() in one pass
+_CLEAN_TABLE = str.maketrans({
+    '\xa0': ' ',    # non-breaking space
+    '\u2007': ' ',  # figure space
+    '\u202f': ' ',  # narrow no-break space
+    '\u2060': ' ',  # word joiner
+    '—': '-',       # em dash
+    '–': '-',       # en dash
+    '\t': ' ',
+})
+
+_MULTI_SPACE_RE = re.compile(r'  +')
+
+# Everything except letters (incl. umlauts/accents), hyphens and whitespace
+_NAME_CLEAN_RE = re.compile(r"[^a-zA-ZÀ-ÿÖÄÜäöüßğşçıİ\-\s]")
+
+# Innermost parenthetical group (no parentheses inside)
+_PAREN_RE = re.compile(r'\([^()]+\)')
+_WS_RE = re.compile(r'\s+')
 
 
 def clean_text(text: str) -> str:
@@ -28,19 +50,11 @@ def clean_text(text: str) -> str:
     - Multiple whitespace → single space
     - Tabs → spaces
     """
-    # Replace non-breaking space with regular space
-    text = text.replace('\xa0', ' ')
-
-    # Handle other unicode spaces
-    text = re.sub(r'[\u00a0\u2007\u202f\u2060]', ' ', text)
-
-    # Normalize dashes (from Open Discourse clean_text)
-    text = text.replace('—', '-')  # em dash
-    text = text.replace('–', '-')  # en dash
+    # Unicode spaces, dashes and tabs in a single pass
+    text = text.translate(_CLEAN_TABLE)
 
     # Normalize whitespace
-    text = re.sub(r'\t+', ' ', text)
-    text = re.sub(r'  +', ' ', text)
+    text = _MULTI_SPACE_RE.sub(' ', text)
 
     return text
 
@@ -53,14 +67,14 @@ def extract_name_parts(name_raw: str) -> dict:
     """
     # Remove non-alphabetic chars except hyphen, umlauts, and accented chars
     # Keep: Latin letters, German umlauts, common accented chars (é, ğ, ş, ç, ó, ñ, etc.)
-    name_clean = re.sub(r"[^a-zA-ZÀ-ÿÖÄÜäöüßğşçıİ\-\s]", " ", name_raw)
-    name_clean = re.sub(r"  +", " ", name_clean).strip()
+    name_clean = _NAME_CLEAN_RE.sub(" ", name_raw)
+    name_clean = _MULTI_SPACE_RE.sub(" ", name_clean).strip()
 
     parts = name_clean.split()
 
     # Extract academic titles
-    titles = [p for p in parts if p in ACADEMIC_TITLES]
-    name_parts = [p for p in parts if p not in ACADEMIC_TITLES]
+    titles = [p for p in parts if p in _ACADEMIC_TITLES]
+    name_parts = [p for p in parts if p not in _ACADEMIC_TITLES]
 
     # Determine first and last name
     if len(name_parts) == 0:
@@ -92,9 +106,11 @@ def strip_parenthetical_content(text: str) -> str:
     These are NOT the speaker's own words and should not be counted
     in word frequency analysis.
     """
-    # Remove all parenthetical content
-    # Use non-greedy match to handle nested parens correctly
-    cleaned = re.sub(r'\([^)]+\)', '', text)
+    # Remove all parenthetical content, innermost groups first so nested
+    # parentheses go away whole. Nesting is rare, so this is usually one pass.
+    cleaned, removed = _PAREN_RE.subn('', text)
+    while removed and '(' in cleaned:
+        cleaned, removed = _PAREN_RE.subn('', cleaned)
     # Clean up extra whitespace
-    cleaned = re.sub(r'\s+', ' ', cleaned)
+    cleaned = _WS_RE.sub(' ', cleaned)
     return cleaned.strip()
@@ -1,43 +1,243 @@
 """Web/JSON export methods for wrapped analysis (mixin class)."""
 
+import heapq
 import random
+from collections import Counter, defaultdict
+from functools import cached_property
+from itertools import islice
+from operator import itemgetter
+
+import numpy as np
+import orjson
+
+# Tone export rankings: (JSON name, tone_data key, default score, rounding digits).
+# Adjective-based (Scheme D), verb-based (Scheme D), then extended (Scheme E).
+_TONE_RANKINGS = (
+    ("affirmative", "affirmative", 50, 1),
+    ("aggression", "aggression", 0, 1),
+    ("labeling", "labeling", 0, 1),
+    ("solutionFocus", "solution_focus", 50, 1),
+    ("collaboration", "collaboration", 50, 1),
+    ("demandIntensity", "demand_intensity", 0, 1),
+    ("acknowledgment", "acknowledgment", 0, 1),
+    ("authority", "authority", 50, 1),
+    ("futureOrientation", "future_orientation", 50, 1),
+    ("emotionalIntensity", "emotional_intensity", 50, 1),
+    ("inclusivity", "inclusivity", 50, 1),
+    ("discriminatory", "discriminatory", 0, 2),
+)
+
+# tone_data key and default for each ToneScores field, in dataclass field order
+_TONE_FIELDS = (
+    ("affirmative", 50.0),
+    ("aggression", 0.0),
+    ("labeling", 0.0),
+    ("solution_focus", 50.0),
+    ("collaboration", 50.0),
+    ("demand_intensity", 0.0),
+    ("acknowledgment", 0.0),
+    ("authority", 50.0),
+    ("future_orientation", 50.0),
+    ("emotional_intensity", 50.0),
+    ("inclusivity", 50.0),
+    ("discriminatory", 0.0),
+)
 
 
 class ExportMixin:
     """Mixin providing export functionality for WrappedData."""
 
+    @cached_property
+    def _moin_counts(self) -> Counter[tuple[str, str]]:
+        """Count 'Moin' greetings per (speaker, party), computed once per instance."""
+        moin_counts: Counter[tuple[str, str]] = Counter()
+        for speech in self.all_speeches:
+            count = speech.get('text', '').lower().count('moin')
+            if count > 0:
+                moin_counts[(speech['speaker'], speech['party'])] += count
+        return moin_counts
+
+    @cached_property
+    def _party_topic_counts(self) -> dict[str, tuple[int, np.ndarray]]:
+        """Tokenize speeches once per instance for topic analysis.
+
+        Returns: {party: (number of 4+ letter words, topic hit counts by topic id)}
+        """
+        from .speaker_export.constants import TOPIC_NAMES, TOPIC_WORD_TO_ID, WORD_PATTERN
+
+        # Group speech texts by party, then tokenize each party's text at once.
+        # Only parties listed in metadata are counted, as in the other sections.
+        valid_parties = frozenset(self.metadata.get("parties") or ())
+        texts_by_party: dict[str, list[str]] = {}
+        for speech in self.all_speeches:
+            party = speech.get("party", "")
+            text = speech.get("text", "")
+            if party not in valid_parties or not text:
+                continue
+            texts_by_party.setdefault(party, []).append(text)
+
+        # filter()/map() look words up in C; bincount scatter-adds the topic ids
+        is_topic_word = TOPIC_WORD_TO_ID.__contains__
+        topic_id = TOPIC_WORD_TO_ID.__getitem__
+        n_topics = len(TOPIC_NAMES)
+        party_topic_counts = {}
+        for party, texts in texts_by_party.items():
+            words = WORD_PATTERN.findall("\n".join(texts).lower())
+            ids = np.fromiter(map(topic_id, filter(is_topic_word, words)), dtype=np.intp)
+            party_topic_counts[party] = (len(words), np.bincount(ids, minlength=n_topics))
+        return party_topic_counts
+
+    @cached_property
+    def _speaker_options(self) -> list[str]:
+        """Unique "Name (Party)" quiz options in order of first speech."""
+        return list(dict.fromkeys(
+            f"{speech['speaker']} ({speech['party']})" for speech in self.all_speeches
+        ))
+
+    @cached_property
+    def _all_questioners_sorted(self) -> list[tuple[str, str, int]]:
+        """All (speaker, party, questions) from question_speaker_stats, most first."""
+        all_questioners = [
+            (speaker, party, count)
+            for party, counts in self.question_speaker_stats.items()
+            for speaker, count in counts.items()
+        ]
+        return sorted(all_questioners, key=itemgetter(2), reverse=True)
+
+    # Query results shared by the quiz, web export, fun facts and gender
+    # export. Rankings are computed once at the largest n any caller uses;
+    # callers needing fewer slice them, which matches calling the query with
+    # the smaller n because every ranking is a stable top-n selection.
+
+    @cached_property
+    def _signature_words(self) -> dict[str, list[tuple[str, float]]]:
+        """Top-5 distinctive nouns per party."""
+        return {
+            party: self.get_distinctive_words(party, "nouns", 5)
+            for party in self.metadata.get("parties") or ()
+        }
+
+    @cached_property
+    def _key_topics(self) -> dict[str, list[tuple[str, int, float]]]:
+        """Top-5 key topic nouns per party."""
+        return {
+            party: self.get_key_topics(party, "nouns", 5)
+            for party in self.metadata.get("parties") or ()
+        }
+
+    @cached_property
+    def _adjectives_by_category(self) -> dict[str, dict[str, list[tuple[str, int]]]]:
+        """Top-5 adjectives of every category per party."""
+        return {
+            party: self._category_top_words(party, "adjectives")
+            for party in self.metadata.get("parties") or ()
+        }
+
+    @cached_property
+    def _top_interrupters(self) -> list[tuple[str, str, int]]:
+        """Top 5 interrupters."""
+        return self.get_top_interrupters(5)
+
+    @cached_property
+    def _applause_ranking(self) -> list[tuple[str, int]]:
+        """Top 5 parties by applause."""
+        return self.get_applause_ranking(5)
+
+    @cached_property
+    def _heckle_ranking(self) -> list[tuple[str, int]]:
+        """Top 5 parties by interjections."""
+        return self.get_heckle_ranking(5)
+
+    @cached_property
+    def _top_speakers(self) -> list[tuple[str, str, int]]:
+        """Top 20 speakers by formal speeches."""
+        return self.get_top_speakers(20)
+
+    @cached_property
+    def _wordiest_speakers(self) -> list[tuple[str, str, int, int]]:
+        """Top 20 speakers by total words."""
+        return self.get_wordiest_speakers(20)
+
+    @cached_property
+    def _hot_topics(self) -> list[str]:
+        """Top 15 words discussed by several parties."""
+        return self.get_hot_topics(15)
+
+    @cached_property
+    def _aggression_ranking(self) -> list[tuple[str, float]]:
+        """Parties by aggression score."""
+        return self.get_aggression_ranking()
+
+    @cached_property
+    def _labeling_ranking(self) -> list[tuple[str, float]]:
+        """Parties by labeling score."""
+        return self.get_labeling_ranking()
+
+    @cached_property
+    def _collaboration_ranking(self) -> list[tuple[str, float]]:
+        """Parties by collaboration score."""
+        return self.get_collaboration_ranking()
+
+    @cached_property
+    def _gender_distribution(self) -> dict[str, int]:
+        """Overall speaker gender distribution."""
+        return self.get_gender_distribution()
+
+    @cached_property
+    def _gender_ratio_by_party(self) -> list[tuple[str, float]]:
+        """Parties by share of female speakers."""
+        return self.get_gender_ratio_by_party()
+
+    @cached_property
+    def _top_female_speakers(self) -> list[tuple[str, str, int]]:
+        """Top 10 female speakers over all Wortmeldungen."""
+        return self.get_top_female_speakers(10, False)
+
+    @cached_property
+    def _interruption_patterns_by_gender(self) -> dict[str, dict[str, int]]:
+        """Interruption counts between genders."""
+        return self.get_interruption_patterns_by_gender()
+
+    @cached_property
+    def _academic_titles_by_gender(self) -> dict[str, float]:
+        """Academic title shares by gender."""
+        return self.get_academic_titles_by_gender()
+
     def _generate_quiz_questions(self) -> list[dict]:
         """Generate quiz questions from the data."""
         questions = []
-        parties = self.metadata.get("parties", [])
+        # Bound once: this method is a long chain of lookups on the same objects
+        append_question = questions.append
+        shuffle = random.shuffle
+        party_stats = self.party_stats
+        drama_stats = self.drama_stats
+        parties = self.metadata.get("parties") or ()
+        speeches_per_party = {
+            p: party_stats.get(p, {}).get("real_speeches", 0) for p in parties
+        }
 
         # Get signature words for word-guessing quizzes
         party_signatures = {}
         for party in parties:
-            sigs = self.get_distinctive_words(party, "nouns", 5)
+            sigs = self._signature_words[party]
             if sigs:
                 party_signatures[party] = sigs
 
         # Quiz 0: Rank the top word from a party
         # Show 4 signature words from one party, user guesses which is #1
         # Tie-breaker: party with more speeches wins if ratios are equal
-        best_party = None
-        best_ratio = 0
-        best_speeches = 0
-        for party, sigs in party_signatures.items():
-            if len(sigs) >= 4:
-                party_speeches = self.party_stats.get(party, {}).get("real_speeches", 0)
-                if sigs[0][1] > best_ratio or (sigs[0][1] == best_ratio and party_speeches > best_speeches):
-                    best_party = party
-                    best_ratio = sigs[0][1]
-                    best_speeches = party_speeches
-
-        if best_party and len(party_signatures[best_party]) >= 4:
+        best_party = max(
+            (p for p, sigs in party_signatures.items() if len(sigs) >= 4),
+            key=lambda p: (party_signatures[p][0][1], speeches_per_party[p]),
+            default=None,
+        )
+
+        if best_party:
             sigs = party_signatures[best_party]
             correct_word, ratio = sigs[0]  # #1 word
             options = [w for w, r in sigs[:4]]
-            random.shuffle(options)
-            questions.append({
+            shuffle(options)
+            append_question({
                 "id": "quiz-signature",
                 "type": "prediction",
                 "question": f"Welches Wort nutzt {best_party} am meisten im Vergleich zu anderen?",
@@ -50,29 +250,24 @@ class ExportMixin:
         # Show 4 key topics from one party, user guesses which is #1
         party_topics = {}
         for party in parties:
-            topics = self.get_key_topics(party, "nouns", 5)
+            topics = self._key_topics[party]
             if topics and len(topics) >= 4:
                 party_topics[party] = topics
 
         # Pick a different party than Quiz 0 for variety
         # Tie-breaker: party with more speeches wins if ratios are equal
-        quiz1_party = None
-        quiz1_ratio = 0
-        quiz1_speeches = 0
-        for party, topics in party_topics.items():
-            if party != best_party:
-                party_speeches = self.party_stats.get(party, {}).get("real_speeches", 0)
-                if topics[0][2] > quiz1_ratio or (topics[0][2] == quiz1_ratio and party_speeches > quiz1_speeches):
-                    quiz1_party = party
-                    quiz1_ratio = topics[0][2]
-                    quiz1_speeches = party_speeches
-
-        if quiz1_party and len(party_topics[quiz1_party]) >= 4:
+        quiz1_party = max(
+            (p for p in party_topics if p != best_party),
+            key=lambda p: (party_topics[p][0][2], speeches_per_party[p]),
+            default=None,
+        )
+
+        if quiz1_party:
             topics = party_topics[quiz1_party]
             correct_word, count, ratio = topics[0]  # #1 topic
             options = [w for w, c, r in topics[:4]]
-            random.shuffle(options)
-            questions.append({
+            shuffle(options)
+            append_question({
                 "id": "quiz-party-topic",
                 "type": "prediction",
                 "question": f"Welches Wort nutzt {quiz1_party} am meisten im Vergleich zu anderen?",
@@ -82,14 +277,17 @@ class ExportMixin:
             })
 
         # Quiz: Most speeches
-        party_speeches = [(p, self.party_stats.get(p, {}).get("real_speeches", 0)) for p in parties]
-        party_speeches.sort(key=lambda x: x[1], reverse=True)
+        party_speeches = heapq.nlargest(
+            4,
+            speeches_per_party.items(),
+            key=itemgetter(1),
+        )
         if party_speeches:
             top_party = party_speeches[0][0]
             top_count = party_speeches[0][1]
-            options = [p for p, _ in party_speeches[:4]]
-            random.shuffle(options)
-            questions.append({
+            options = [p for p, _ in party_speeches]
+            shuffle(options)
+            append_question({
                 "id": "quiz-speeches",
                 "type": "prediction",
                 "question": "Welche Partei hat die meisten Reden gehalten?",
@@ -99,12 +297,12 @@ class ExportMixin:
             })
 
         # Quiz: Top interrupter
-        interrupters = self.get_top_interrupters(4)
+        interrupters = self._top_interrupters[:4]
         if interrupters:
             top_name, top_party, top_count = interrupters[0]
             options = [f"{n} ({p})" for n, p, _ in interrupters]
-            random.shuffle(options)
-            questions.append({
+            shuffle(options)
+            append_question({
                 "id": "quiz-interrupter",
                 "type": "prediction",
                 "question": "Wer hat am meisten unterbrochen?",
@@ -114,12 +312,12 @@ class ExportMixin:
             })
 
         # Quiz: Applause champion
-        applause = self.get_applause_ranking(4)
+        applause = self._applause_ranking[:4]
         if applause:
             top_party, top_count = applause[0]
             options = [p for p, _ in applause]
-            random.shuffle(options)
-            questions.append({
+            shuffle(options)
+            append_question({
                 "id": "quiz-applause",
                 "type": "prediction",
                 "question": "Welche Partei applaudiert am meisten?",
@@ -129,12 +327,12 @@ class ExportMixin:
             })
 
         # Quiz: Loudest heckler
-        heckles = self.get_heckle_ranking(4)
+        heckles = self._heckle_ranking[:4]
         if heckles:
             top_party, top_count = heckles[0]
             options = [p for p, _ in heckles]
-            random.shuffle(options)
-            questions.append({
+            shuffle(options)
+            append_question({
                 "id": "quiz-heckler",
                 "type": "prediction",
                 "question": "Welche Partei ruft am lautesten dazwischen?",
@@ -144,12 +342,12 @@ class ExportMixin:
             })
 
         # Quiz: Top speaker
-        speakers = self.get_top_speakers(4)
+        speakers = self._top_speakers[:4]
         if speakers:
             top_name, top_party, top_count = speakers[0]
             options = [f"{n} ({p})" for n, p, _ in speakers]
-            random.shuffle(options)
-            questions.append({
+            shuffle(options)
+            append_question({
                 "id": "quiz-speakers",
                 "type": "prediction",
                 "question": "Wer hat die meisten Reden gehalten?",
@@ -159,12 +357,12 @@ class ExportMixin:
             })
 
         # Quiz: Most words total
-        wordiest = self.get_wordiest_speakers(4)
+        wordiest = self._wordiest_speakers[:4]
         if wordiest:
             top_name, top_party, total_words, speech_count = wordiest[0]
             options = [f"{n} ({p})" for n, p, _, _ in wordiest]
-            random.shuffle(options)
-            questions.append({
+            shuffle(options)
+            append_question({
                 "id": "quiz-words-total",
                 "type": "prediction",
                 "question": "Wer hat insgesamt die meisten Wörter gesprochen?",
@@ -174,9 +372,9 @@ class ExportMixin:
             })
 
         # Quiz: Hot topic
-        hot = self.get_hot_topics(4)
+        hot = self._hot_topics[:4]
         if hot:
-            questions.append({
+            append_question({
                 "id": "quiz-hot-topic",
                 "type": "prediction",
                 "question": "Welches Wort ist bei den meisten Parteien unter den Top-Themen?",
@@ -186,16 +384,7 @@ class ExportMixin:
             })
 
         # Quiz: Which individual person says Moin the most?
-        from collections import Counter
-        moin_person_counts = Counter()
-        for speech in self.all_speeches:
-            text = speech.get('text', '').lower()
-            count = text.count('moin')
-            if count > 0:
-                speaker = speech['speaker']
-                party = speech['party']
-                moin_person_counts[(speaker, party)] += count
-
+        moin_person_counts = self._moin_counts
         if moin_person_counts:
             top_moin_people = moin_person_counts.most_common(4)
             top_speaker, top_party = top_moin_people[0][0]
@@ -203,14 +392,13 @@ class ExportMixin:
             options = [f"{s} ({p})" for (s, p), _ in top_moin_people]
             # Add more options if needed
             if len(options) < 4:
-                for speech in self.all_speeches[:20]:
-                    opt = f"{speech['speaker']} ({speech['party']})"
-                    if opt not in options:
-                        options.append(opt)
-                    if len(options) >= 4:
-                        break
-            random.shuffle(options)
-            questions.append({
+                taken = set(options)
+                options.extend(islice(
+                    (opt for opt in self._speaker_options if opt not in taken),
+                    4 - len(options),
+                ))
+            shuffle(options)
+            append_question({
                 "id": "quiz-moin-person",
                 "type": "prediction",
                 "question": 'Welche Person sagt am häufigsten "Moin"?',
@@ -220,17 +408,17 @@ class ExportMixin:
             })
 
         # Quiz: Most unique speakers (spread of speakers)
-        speaker_spread = [
-            (p, len(self.speaker_stats.get(p, {})))
-            for p in parties
-        ]
-        speaker_spread.sort(key=lambda x: x[1], reverse=True)
+        speaker_spread = heapq.nlargest(
+            4,
+            ((p, len(self.speaker_stats.get(p) or ())) for p in parties),
+            key=itemgetter(1),
+        )
         if speaker_spread:
             top_party = speaker_spread[0][0]
             top_count = speaker_spread[0][1]
-            options = [p for p, _ in speaker_spread[:4]]
-            random.shuffle(options)
-            questions.append({
+            options = [p for p, _ in speaker_spread]
+            shuffle(options)
+            append_question({
                 "id": "quiz-speaker-spread",
                 "type": "prediction",
                 "question": "Welche Fraktion hat die meisten verschiedenen Redner?",
@@ -240,16 +428,12 @@ class ExportMixin:
             })
 
         # Quiz: Top question asker (Fragestunde/Regierungsbefragung)
-        all_questioners = []
-        for party, counts in self.question_speaker_stats.items():
-            for speaker, count in counts.items():
-                all_questioners.append((speaker, party, count))
-        all_questioners.sort(key=lambda x: x[2], reverse=True)
-        if all_questioners:
-            top_name, top_party, top_count = all_questioners[0]
-            options = [f"{n} ({p})" for n, p, _ in all_questioners[:4]]
-            random.shuffle(options)
-            questions.append({
+        top_questioners = self._all_questioners_sorted[:4]
+        if top_questioners:
+            top_name, top_party, top_count = top_questioners[0]
+            options = [f"{n} ({p})" for n, p, _ in top_questioners]
+            shuffle(options)
+            append_question({
                 "id": "quiz-zwischenfragen",
                 "type": "prediction",
                 "question": "Wer stellt die meisten Fragen in der Fragestunde?",
@@ -264,12 +448,12 @@ class ExportMixin:
 
         if self.has_tone_data():
             # Quiz 12: Most aggressive party
-            agg_ranking = self.get_aggression_ranking()
+            agg_ranking = self._aggression_ranking
             if agg_ranking and len(agg_ranking) >= 4:
                 top_party, top_score = agg_ranking[0]
                 options = [p for p, _ in agg_ranking[:4]]
-                random.shuffle(options)
-                questions.append({
+                shuffle(options)
+                append_question({
                     "id": "quiz-aggressive",
                     "type": "prediction",
                     "question": "Welche Partei nutzt die aggressivste Sprache?",
@@ -279,12 +463,12 @@ class ExportMixin:
                 })
 
             # Quiz 13: Most labeling party
-            label_ranking = self.get_labeling_ranking()
+            label_ranking = self._labeling_ranking
             if label_ranking and len(label_ranking) >= 4:
                 top_party, top_score = label_ranking[0]
                 options = [p for p, _ in label_ranking[:4]]
-                random.shuffle(options)
-                questions.append({
+                shuffle(options)
+                append_question({
                     "id": "quiz-labeling",
                     "type": "prediction",
                     "question": 'Wer nutzt am meisten "ideologische Labels"?',
@@ -294,12 +478,12 @@ class ExportMixin:
                 })
 
             # Quiz 14: Most collaborative party
-            collab_ranking = self.get_collaboration_ranking()
+            collab_ranking = self._collaboration_ranking
             if collab_ranking and len(collab_ranking) >= 4:
                 top_party, top_score = collab_ranking[0]
                 options = [p for p, _ in collab_ranking[:4]]
-                random.shuffle(options)
-                questions.append({
+                shuffle(options)
+                append_question({
                     "id": "quiz-collaborative",
                     "type": "prediction",
                     "question": "Welche Fraktion nutzt die kooperativste Sprache?",
@@ -313,8 +497,8 @@ class ExportMixin:
             if solution_ranking and len(solution_ranking) >= 4:
                 top_party, top_score = solution_ranking[0]
                 options = [p for p, _ in solution_ranking[:4]]
-                random.shuffle(options)
-                questions.append({
+                shuffle(options)
+                append_question({
                     "id": "quiz-solution",
                     "type": "prediction",
                     "question": "Welche Partei spricht am lösungsorientiertesten?",
@@ -328,8 +512,8 @@ class ExportMixin:
             if demand_ranking and len(demand_ranking) >= 4:
                 top_party, top_score = demand_ranking[0]
                 options = [p for p, _ in demand_ranking[:4]]
-                random.shuffle(options)
-                questions.append({
+                shuffle(options)
+                append_question({
                     "id": "quiz-demanding",
                     "type": "prediction",
                     "question": "Welche Partei fordert am meisten?",
@@ -344,12 +528,12 @@ class ExportMixin:
 
         if self.has_gender_data():
             # Quiz 18: Highest female ratio party
-            gender_ratios = self.get_gender_ratio_by_party()
+            gender_ratios = self._gender_ratio_by_party
             if gender_ratios and len(gender_ratios) >= 4:
                 top_party, top_ratio = gender_ratios[0]
                 options = [p for p, _ in gender_ratios[:4]]
-                random.shuffle(options)
-                questions.append({
+                shuffle(options)
+                append_question({
                     "id": "quiz-gender-ratio",
                     "type": "prediction",
                     "question": "Welche Fraktion hat den höchsten Frauenanteil?",
@@ -359,12 +543,12 @@ class ExportMixin:
                 })
 
             # Quiz 19: Top female speaker
-            top_female = self.get_top_female_speakers(4)
+            top_female = self._top_female_speakers[:4]
             if top_female:
                 top_name, top_party, top_count = top_female[0]
                 options = [f"{n} ({p})" for n, p, _ in top_female]
-                random.shuffle(options)
-                questions.append({
+                shuffle(options)
+                append_question({
                     "id": "quiz-top-female",
                     "type": "prediction",
                     "question": "Welche Frau hielt die meisten Reden?",
@@ -374,7 +558,7 @@ class ExportMixin:
                 })
 
             # Quiz 20: Who interrupts more - men or women?
-            patterns = self.get_interruption_patterns_by_gender()
+            patterns = self._interruption_patterns_by_gender
             male_interrupts = patterns["interruptions_made"]["male"]
             female_interrupts = patterns["interruptions_made"]["female"]
             if male_interrupts > 0 or female_interrupts > 0:
@@ -386,7 +570,7 @@ class ExportMixin:
                     correct = "Frauen"
                     ratio = female_interrupts / male_interrupts if male_interrupts > 0 else female_interrupts
                     explanation = f"Frauen unterbrechen {ratio:.1f}x häufiger ({female_interrupts:,} vs {male_interrupts:,})!"
-                questions.append({
+                append_question({
                     "id": "quiz-gender-interrupts",
                     "type": "prediction",
                     "question": "Wer unterbricht häufiger?",
@@ -396,7 +580,7 @@ class ExportMixin:
                 })
 
             # Quiz 21: Academic titles by gender
-            academic = self.get_academic_titles_by_gender()
+            academic = self._academic_titles_by_gender
             male_dr = academic.get("male", 0)
             female_dr = academic.get("female", 0)
             if male_dr > 0 or female_dr > 0:
@@ -406,7 +590,7 @@ class ExportMixin:
                 else:
                     correct = "Frauen"
                     explanation = f"Frauen: {female_dr*100:.0f}% Dr., Männer: {male_dr*100:.0f}%"
-                questions.append({
+                append_question({
                     "id": "quiz-academic-titles",
                     "type": "prediction",
                     "question": "Wer hat häufiger einen Doktortitel?",
@@ -421,30 +605,36 @@ class ExportMixin:
         # Formula: score = negative_count × √(total_count)
         # This rewards both high negative count AND high volume
         import math
-        interrupters = self.drama_stats.get("interrupters", {})
-        negative = self.drama_stats.get("negative_interjections", {})
-
-        # Calculate volume-weighted scores for people with ≥50 total interjections
-        critic_scores = []
-        for (name, party), total in interrupters.items():
-            if total >= 50:
-                neg_count = negative.get((name, party), 0)
-                score = neg_count * math.sqrt(total)
-                if neg_count > 0:
-                    critic_scores.append((name, party, neg_count, total, score))
-
-        critic_scores.sort(key=lambda x: x[4], reverse=True)
+        interrupters = drama_stats.get("interrupters", {})
+        negative = drama_stats.get("negative_interjections", {})
+
+        # Calculate volume-weighted scores for people with ≥50 total interjections.
+        # Only speakers with negative interjections can score, so walk that
+        # (smaller) dict and look up their totals.
+        # Filter first so only the few survivors get unpacked and scored.
+        sqrt = math.sqrt
+        get_total = interrupters.get
+        candidates = [
+            (key, neg_count, total)
+            for key, neg_count in negative.items()
+            if neg_count > 0 and (total := get_total(key, 0)) >= 50
+        ]
+        critic_scores = [
+            (name, party, neg_count, total, neg_count * sqrt(total), neg_count / total)
+            for (name, party), neg_count, total in candidates
+        ]
 
         if critic_scores and len(critic_scores) >= 4:
-            top_name, top_party, top_neg, top_total, top_score = critic_scores[0]
-            # Get rate leader for explanation
-            rate_leader = max(critic_scores, key=lambda x: x[2] / x[3])
+            top_critics = heapq.nlargest(4, critic_scores, key=itemgetter(4))
+            top_name, top_party, top_neg, top_total, top_score, _ = top_critics[0]
+            # Get rate leader for explanation (ties go to the higher score)
+            rate_leader = max(critic_scores, key=itemgetter(5, 4))
             rate_name, rate_party, rate_neg, rate_total = rate_leader[:4]
             rate_pct = round(rate_neg / rate_total * 100)
 
-            options = [f"{n} ({p})" for n, p, _, _, _ in critic_scores[:4]]
-            random.shuffle(options)
-            questions.append({
+            options = [f"{n} ({p})" for n, p, *_ in top_critics]
+            shuffle(options)
+            append_question({
                 "id": "quiz-biggest-critic",
                 "type": "prediction",
                 "question": "Wer ruft am meisten kritisch dazwischen (absolut)?",
@@ -457,17 +647,31 @@ class ExportMixin:
 
     def to_web_json(self) -> dict:
         """Export data in format expected by web app."""
+        parties = self.metadata.get("parties") or ()
+
+        # One pass over all speeches for per-party totals and the rede count
+        party_totals: defaultdict[str, int] = defaultdict(int)
+        total_reden = 0
+        for s in self.all_speeches:
+            party_totals[s.get('party')] += 1
+            # Speeches without a category count as rede only if their type is
+            category = s.get('category')
+            if category == 'rede' or (
+                category is None and 'category' not in s and s.get('type') == 'rede'
+            ):
+                total_reden += 1
+
         parties_data = []
-        for party in self.metadata.get("parties", []):
+        for party in parties:
             stats = self.party_stats.get(party, {})
             style = self.get_communication_style(party)
             champion = self.get_party_champion(party)
 
             # Count unique speakers for this party
-            unique_speakers = len(self.speaker_stats.get(party, {}))
+            unique_speakers = len(self.speaker_stats.get(party) or ())
 
             # Calculate wortbeitraege (all speeches minus formal speeches)
-            party_total_speeches = len([s for s in self.all_speeches if s.get('party') == party])
+            party_total_speeches = party_totals.get(party, 0)
             party_formal_speeches = stats.get("real_speeches", stats.get("speeches", 0))
             party_wortbeitraege = party_total_speeches - party_formal_speeches
 
@@ -483,11 +687,11 @@ class ExportMixin:
                 ],
                 "signatureWords": [
                     {"word": w, "ratio": round(r, 1)}
-                    for w, r in self.get_distinctive_words(party, "nouns", 5)
+                    for w, r in self._signature_words[party]
                 ],
                 "keyTopics": [
                     {"word": w, "count": c, "ratio": round(r, 1)}
-                    for w, c, r in self.get_key_topics(party, "nouns", 5)
+                    for w, c, r in self._key_topics[party]
                 ],
                 "avgSpeechLength": int(style.get("avg_speech_length", 0)),
                 "descriptiveness": round(style.get("descriptiveness", 0) * 100, 1),
@@ -497,8 +701,6 @@ class ExportMixin:
                 } if champion else {"name": "", "speeches": 0},
             })
 
-        # Calculate total reden and wortbeitraege
-        total_reden = sum(1 for s in self.all_speeches if s.get('category', 'rede' if s.get('type') == 'rede' else 'wortbeitrag') == 'rede')
         total_wortbeitraege = len(self.all_speeches) - total_reden
 
         return {
@@ -507,7 +709,7 @@ class ExportMixin:
                 "redenCount": total_reden,
                 "wortbeitraegeCount": total_wortbeitraege,
                 "totalWords": self.metadata.get("total_words", 0),
-                "partyCount": len(self.metadata.get("parties", [])),
+                "partyCount": len(parties),
                 "speakerCount": self.get_unique_speaker_count(),
                 "wahlperiode": self.metadata.get("wahlperiode", 0),
                 "sitzungen": self.metadata.get("sitzungen", 50),
@@ -516,7 +718,7 @@ class ExportMixin:
             "drama": {
                 "topZwischenrufer": [
                     {"name": n, "party": p, "count": c}
-                    for n, p, c in self.get_top_interrupters(5)
+                    for n, p, c in self._top_interrupters
                 ],
                 "mostInterrupted": [
                     {"name": n, "party": p, "count": c}
@@ -524,17 +726,17 @@ class ExportMixin:
                 ],
                 "applauseChampions": [
                     {"party": p, "count": c}
-                    for p, c in self.get_applause_ranking(5)
+                    for p, c in self._applause_ranking
                 ],
                 "loudestHecklers": [
                     {"party": p, "count": c}
-                    for p, c in self.get_heckle_ranking(5)
+                    for p, c in self._heckle_ranking
                 ],
                 "zwischenrufStats": self._build_zwischenruf_stats(),
             },
             "topSpeakers": [
                 {"name": n, "party": p, "speeches": c}
-                for n, p, c in self.get_top_speakers(20)
+                for n, p, c in self._top_speakers
             ],
             "topBefragungResponders": [
                 {"name": n, "party": p, "responses": c}
@@ -542,13 +744,13 @@ class ExportMixin:
             ],
             "topSpeakersByWords": [
                 {"name": n, "party": p, "totalWords": w, "speeches": c}
-                for n, p, w, c in self.get_wordiest_speakers(20)
+                for n, p, w, c in self._wordiest_speakers
             ],
             "topSpeakersByAvgWords": [
                 {"name": n, "party": p, "avgWords": avg, "totalWords": w, "speeches": c}
                 for n, p, avg, w, c in self.get_speakers_by_avg_words(20, min_speeches=5)
             ],
-            "hotTopics": self.get_hot_topics(15),
+            "hotTopics": self._hot_topics,
             "toneAnalysis": self._build_tone_analysis_json() if self.has_tone_data() else None,
             "topicAnalysis": self._build_topic_analysis_json(),
             "funFacts": self._generate_fun_facts(),
@@ -558,30 +760,51 @@ class ExportMixin:
             "topQuestionAskers": self._get_top_question_askers(10),
         }
 
+    def to_web_json_bytes(self, web_data: dict | None = None) -> bytes:
+        """Serialize to_web_json() as indented UTF-8 JSON using orjson.
+
+        Output matches json.dumps(..., ensure_ascii=False, indent=2). Query
+        results can contain numpy scalars (e.g. pandas-derived ratios), which
+        orjson serializes natively with OPT_SERIALIZE_NUMPY.
+
+        Args:
+            web_data: An already built to_web_json() result, to avoid rebuilding it
+        """
+        if web_data is None:
+            web_data = self.to_web_json()
+        return orjson.dumps(
+            web_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+
+    def _category_top_words(
+        self, party: str, word_type: str, n: int = 5
+    ) -> dict[str, list[tuple[str, int]]]:
+        """Top n words of every category of a word type, in one walk.
+
+        Same per-category results as get_top_words_by_category().
+        Returns: {category: [(word, count), ...]}
+        """
+        if party not in self.category_data:
+            return {}
+        return {
+            category: heapq.nlargest(n, words.items(), key=itemgetter(1))
+            for category, words in self.category_data[party].get(word_type, {}).items()
+            if isinstance(words, dict)
+        }
+
     def _get_moin_speakers(self, limit: int) -> list[dict]:
         """Get speakers who say 'Moin' most often."""
-        from collections import Counter
-        moin_counts: Counter[tuple[str, str]] = Counter()
-        for speech in self.all_speeches:
-            text = speech.get("text", "").lower()
-            count = text.count("moin")
-            if count > 0:
-                moin_counts[(speech["speaker"], speech["party"])] += count
         return [
             {"name": n, "party": p, "count": c}
-            for (n, p), c in moin_counts.most_common(limit)
+            for (n, p), c in self._moin_counts.most_common(limit)
         ]
 
     def _get_top_question_askers(self, limit: int) -> list[dict]:
         """Get top question askers from Fragestunde/Regierungsbefragung."""
-        all_questioners = []
-        for party, counts in self.question_speaker_stats.items():
-            for speaker, count in counts.items():
-                all_questioners.append((speaker, party, count))
-        all_questioners.sort(key=lambda x: x[2], reverse=True)
         return [
             {"name": n, "party": p, "count": c}
-            for n, p, c in all_questioners[:limit]
+            for n, p, c in self._all_questioners_sorted[:limit]
         ]
 
     def _build_zwischenruf_stats(self) -> dict:
@@ -595,14 +818,21 @@ class ExportMixin:
         total_neutral = sum(neutral.values())
         total_all = total_positive + total_negative + total_neutral
 
+        positive_pct = negative_pct = neutral_pct = 0
+        if total_all > 0:
+            scale = 100 / total_all
+            positive_pct = round(total_positive * scale, 1)
+            negative_pct = round(total_negative * scale, 1)
+            neutral_pct = round(total_neutral * scale, 1)
+
         return {
             "total": total_all,
             "positive": total_positive,
             "negative": total_negative,
             "neutral": total_neutral,
-            "positivePercent": round(total_positive / total_all * 100, 1) if total_all > 0 else 0,
-            "negativePercent": round(total_negative / total_all * 100, 1) if total_all > 0 else 0,
-            "neutralPercent": round(total_neutral / total_all * 100, 1) if total_all > 0 else 0,
+            "positivePercent": positive_pct,
+            "negativePercent": negative_pct,
+            "neutralPercent": neutral_pct,
             "classification": {
                 "positive": "Zustimmung (genau, richtig, bravo, stimmt, ...)",
                 "negative": "Kritik (unsinn, quatsch, falsch, lüge, ...)",
@@ -614,6 +844,7 @@ class ExportMixin:
         """Generate fun facts including tone analysis insights."""
         facts = []
         meta = self.metadata
+        parties = meta.get("parties") or ()
 
         # Basic stats facts
         total_words = meta.get("total_words", 0)
@@ -650,7 +881,7 @@ class ExportMixin:
         # Tone analysis facts (Scheme D)
         if self.has_tone_data():
             # Most aggressive party
-            agg_ranking = self.get_aggression_ranking()
+            agg_ranking = self._aggression_ranking
             if agg_ranking:
                 top_party, top_score = agg_ranking[0]
                 facts.append({
@@ -662,7 +893,7 @@ class ExportMixin:
                 })
 
             # Most labeling party (key Scheme D insight)
-            label_ranking = self.get_labeling_ranking()
+            label_ranking = self._labeling_ranking
             if label_ranking:
                 top_party, top_score = label_ranking[0]
                 if top_score > 1:  # Only show if significant
@@ -675,7 +906,7 @@ class ExportMixin:
                     })
 
             # Most collaborative party
-            collab_ranking = self.get_collaboration_ranking()
+            collab_ranking = self._collaboration_ranking
             if collab_ranking:
                 top_party, top_score = collab_ranking[0]
                 facts.append({
@@ -688,8 +919,8 @@ class ExportMixin:
 
             # Top labeling word (key insight)
             best_label = None
-            for party in self.metadata.get("parties", []):
-                words = self.get_top_words_by_category(party, "adjectives", "labeling", 1)
+            for party in parties:
+                words = self._adjectives_by_category[party].get("labeling")
                 if words:
                     word, count = words[0]
                     if best_label is None or count > best_label[1]:
@@ -707,8 +938,8 @@ class ExportMixin:
 
             # Top aggressive word
             best_word = None
-            for party in self.metadata.get("parties", []):
-                words = self.get_top_words_by_category(party, "adjectives", "aggressive", 1)
+            for party in parties:
+                words = self._adjectives_by_category[party].get("aggressive")
                 if words:
                     word, count = words[0]
                     if best_word is None or count > best_word[1]:
@@ -741,7 +972,7 @@ class ExportMixin:
 
         # Gender analysis facts
         if self.has_gender_data():
-            distribution = self.get_gender_distribution()
+            distribution = self._gender_distribution
             total_known = distribution["male"] + distribution["female"]
 
             if total_known > 0:
@@ -755,7 +986,7 @@ class ExportMixin:
                 })
 
             # Top party by female ratio
-            gender_ratios = self.get_gender_ratio_by_party()
+            gender_ratios = self._gender_ratio_by_party
             if gender_ratios:
                 top_party, top_ratio = gender_ratios[0]
                 facts.append({
@@ -767,7 +998,7 @@ class ExportMixin:
                 })
 
             # Top female speaker
-            top_female = self.get_top_female_speakers(1)
+            top_female = self._top_female_speakers[:1]
             if top_female:
                 name, party, speeches = top_female[0]
                 facts.append({
@@ -779,7 +1010,7 @@ class ExportMixin:
                 })
 
             # Interruption ratio
-            patterns = self.get_interruption_patterns_by_gender()
+            patterns = self._interruption_patterns_by_gender
             male_int = patterns["interruptions_made"]["male"]
             female_int = patterns["interruptions_made"]["female"]
             if male_int > 0 and female_int > 0:
@@ -796,147 +1027,102 @@ class ExportMixin:
 
     def _build_tone_analysis_json(self) -> dict:
         """Build tone analysis section for web JSON export (Scheme D + E)."""
-        from .party_profiles import build_party_profile
+        from .party_profiles import build_party_profiles
         from ..categorizer import ToneScores
 
         parties_tone = []
-        party_profiles = {}
+        tone_data = self.tone_data
 
         # First pass: collect all ToneScores for rank-based comparison
         all_party_scores: dict[str, ToneScores] = {}
-        for party in self.metadata.get("parties", []):
-            if party not in self.tone_data:
+        for party in self.metadata.get("parties") or ():
+            scores_dict = tone_data.get(party)
+            if scores_dict is None:
                 continue
-            scores_dict = self.tone_data[party]
-            all_party_scores[party] = ToneScores(
-                affirmative_score=scores_dict.get("affirmative", 50.0),
-                aggression_index=scores_dict.get("aggression", 0.0),
-                labeling_index=scores_dict.get("labeling", 0.0),
-                solution_focus=scores_dict.get("solution_focus", 50.0),
-                collaboration_score=scores_dict.get("collaboration", 50.0),
-                demand_intensity=scores_dict.get("demand_intensity", 0.0),
-                acknowledgment_rate=scores_dict.get("acknowledgment", 0.0),
-                # Extended scores (Scheme E)
-                authority_index=scores_dict.get("authority", 50.0),
-                future_orientation=scores_dict.get("future_orientation", 50.0),
-                emotional_intensity=scores_dict.get("emotional_intensity", 50.0),
-                inclusivity_index=scores_dict.get("inclusivity", 50.0),
-                discriminatory_index=scores_dict.get("discriminatory", 0.0),
-            )
+            get = scores_dict.get
+            all_party_scores[party] = ToneScores(*[get(key, default) for key, default in _TONE_FIELDS])
 
         # Second pass: build profiles with rank-based classification
-        for party, scores in all_party_scores.items():
-            profile = build_party_profile(party, scores, all_party_scores)
-            party_profiles[party] = profile.to_dict()
+        party_profiles = {
+            party: profile.to_dict()
+            for party, profile in build_party_profiles(all_party_scores).items()
+        }
+        for party in all_party_scores:
+            adjectives = self._adjectives_by_category[party]
+            verbs = self._category_top_words(party, "verbs")
 
             parties_tone.append({
                 "party": party,
-                "scores": self.tone_data[party],
+                "scores": tone_data[party],
                 # Adjective categories (Scheme D)
                 "topAffirmative": [
                     {"word": w, "count": c}
-                    for w, c in self.get_top_words_by_category(party, "adjectives", "affirmative", 5)
+                    for w, c in adjectives.get("affirmative", [])
                 ],
                 "topCritical": [
                     {"word": w, "count": c}
-                    for w, c in self.get_top_words_by_category(party, "adjectives", "critical", 5)
+                    for w, c in adjectives.get("critical", [])
                 ],
                 "topAggressive": [
                     {"word": w, "count": c}
-                    for w, c in self.get_top_words_by_category(party, "adjectives", "aggressive", 5)
+                    for w, c in adjectives.get("aggressive", [])
                 ],
                 "topLabeling": [
                     {"word": w, "count": c}
-                    for w, c in self.get_top_words_by_category(party, "adjectives", "labeling", 5)
+                    for w, c in adjectives.get("labeling", [])
                 ],
                 # Verb categories (Scheme D)
                 "topSolution": [
                     {"word": w, "count": c}
-                    for w, c in self.get_top_words_by_category(party, "verbs", "solution", 5)
+                    for w, c in verbs.get("solution", [])
                 ],
                 "topProblem": [
                     {"word": w, "count": c}
-                    for w, c in self.get_top_words_by_category(party, "verbs", "problem", 5)
+                    for w, c in verbs.get("problem", [])
                 ],
                 "topCollaborative": [
                     {"word": w, "count": c}
-                    for w, c in self.get_top_words_by_category(party, "verbs", "collaborative", 5)
+                    for w, c in verbs.get("collaborative", [])
                 ],
                 "topConfrontational": [
                     {"word": w, "count": c}
-                    for w, c in self.get_top_words_by_category(party, "verbs", "confrontational", 5)
+                    for w, c in verbs.get("confrontational", [])
                 ],
                 "topDemanding": [
                     {"word": w, "count": c}
-                    for w, c in self.get_top_words_by_category(party, "verbs", "demanding", 5)
+                    for w, c in verbs.get("demanding", [])
                 ],
                 "topAcknowledging": [
                     {"word": w, "count": c}
-                    for w, c in self.get_top_words_by_category(party, "verbs", "acknowledging", 5)
+                    for w, c in verbs.get("acknowledging", [])
                 ],
             })
 
+        # Rank every metric from one pass over tone_data. Defaults match the
+        # get_*_ranking() queries.
+        metric_values: dict[str, list[tuple[str, float]]] = {
+            name: [] for name, _, _, _ in _TONE_RANKINGS
+        }
+        for party, scores_dict in tone_data.items():
+            for name, key, default, _ in _TONE_RANKINGS:
+                metric_values[name].append((party, scores_dict.get(key, default)))
+
+        rankings = {}
+        for name, _, _, digits in _TONE_RANKINGS:
+            metric_values[name].sort(key=itemgetter(1), reverse=True)
+            rankings[name] = [
+                {"party": p, "score": round(s, digits)} for p, s in metric_values[name]
+            ]
+        rankings["discriminatoryCounts"] = [
+            {"party": p, "count": c}
+            for p, c in self.get_discriminatory_counts()
+            if p != "fraktionslos"
+        ]
+
         return {
             "parties": parties_tone,
             "partyProfiles": party_profiles,
-            "rankings": {
-                # Adjective-based scores (Scheme D)
-                "affirmative": [
-                    {"party": p, "score": round(s, 1)}
-                    for p, s in self.get_affirmative_ranking()
-                ],
-                "aggression": [
-                    {"party": p, "score": round(s, 1)}
-                    for p, s in self.get_aggression_ranking()
-                ],
-                "labeling": [
-                    {"party": p, "score": round(s, 1)}
-                    for p, s in self.get_labeling_ranking()
-                ],
-                # Verb-based scores (Scheme D)
-                "solutionFocus": [
-                    {"party": p, "score": round(s, 1)}
-                    for p, s in self.get_solution_focus_ranking()
-                ],
-                "collaboration": [
-                    {"party": p, "score": round(s, 1)}
-                    for p, s in self.get_collaboration_ranking()
-                ],
-                "demandIntensity": [
-                    {"party": p, "score": round(s, 1)}
-                    for p, s in self.get_demand_ranking()
-                ],
-                "acknowledgment": [
-                    {"party": p, "score": round(s, 1)}
-                    for p, s in self.get_acknowledgment_ranking()
-                ],
-                # Extended scores (Scheme E)
-                "authority": [
-                    {"party": p, "score": round(s, 1)}
-                    for p, s in self.get_authority_ranking()
-                ],
-                "futureOrientation": [
-                    {"party": p, "score": round(s, 1)}
-                    for p, s in self.get_future_orientation_ranking()
-                ],
-                "emotionalIntensity": [
-                    {"party": p, "score": round(s, 1)}
-                    for p, s in self.get_emotional_intensity_ranking()
-                ],
-                "inclusivity": [
-                    {"party": p, "score": round(s, 1)}
-                    for p, s in self.get_inclusivity_ranking()
-                ],
-                "discriminatory": [
-                    {"party": p, "score": round(s, 2)}
-                    for p, s in self.get_discriminatory_ranking()
-                ],
-                "discriminatoryCounts": [
-                    {"party": p, "count": c}
-                    for p, c in self.get_discriminatory_counts()
-                    if p != "fraktionslos"
-                ],
-            },
+            "rankings": rankings,
         }
 
     def _build_gender_analysis_json(self) -> dict:
@@ -946,13 +1132,14 @@ class ExportMixin:
         - "Reden" (formal speeches): Main podium speeches only
         - "Wortmeldungen" (all activity): Including questions, interventions, etc.
         """
-        distribution = self.get_gender_distribution()
+        distribution = self._gender_distribution
         total_known = distribution["male"] + distribution["female"]
 
         # Per-party gender stats
+        distribution_by_party = self.get_gender_distribution_by_party()
         parties_gender = []
-        for party in self.metadata.get("parties", []):
-            by_party = self.get_gender_distribution_by_party().get(party, {})
+        for party in self.metadata.get("parties") or ():
+            by_party = distribution_by_party.get(party, {})
             male = by_party.get("male", 0)
             female = by_party.get("female", 0)
             total = male + female
@@ -964,10 +1151,10 @@ class ExportMixin:
             })
 
         # Sort by female ratio
-        parties_gender.sort(key=lambda x: x["femaleRatio"], reverse=True)
+        parties_gender.sort(key=itemgetter("femaleRatio"), reverse=True)
 
         # Interruption patterns
-        interruption_patterns = self.get_interruption_patterns_by_gender()
+        interruption_patterns = self._interruption_patterns_by_gender
 
         return {
             "distribution": {
@@ -980,20 +1167,20 @@ class ExportMixin:
             # Formal speeches only (Reden) - comparable to existing wrapped stats
             "topFemaleSpeakersReden": [
                 {"name": n, "party": p, "count": s}
-                for n, p, s in self.get_top_female_speakers(10, formal_only=True)
+                for n, p, s in self.get_top_female_speakers(10, True)
             ],
             "topMaleSpeakersReden": [
                 {"name": n, "party": p, "count": s}
-                for n, p, s in self.get_top_male_speakers(10, formal_only=True)
+                for n, p, s in self.get_top_male_speakers(10, True)
             ],
             # All activity (Wortmeldungen) - includes questions, interventions, etc.
             "topFemaleSpeakersAll": [
                 {"name": n, "party": p, "count": s}
-                for n, p, s in self.get_top_female_speakers(10, formal_only=False)
+                for n, p, s in self._top_female_speakers
             ],
             "topMaleSpeakersAll": [
                 {"name": n, "party": p, "count": s}
-                for n, p, s in self.get_top_male_speakers(10, formal_only=False)
+                for n, p, s in self.get_top_male_speakers(10, False)
             ],
             "interruptionPatterns": {
                 "maleInterruptions": interruption_patterns["interruptions_made"]["male"],
@@ -1002,7 +1189,7 @@ class ExportMixin:
                 "femaleInterrupted": interruption_patterns["interruptions_received"]["female"],
             },
             "speechLength": self.get_speech_length_by_gender(),
-            "academicTitles": self.get_academic_titles_by_gender(),
+            "academicTitles": self._academic_titles_by_gender,
             # Metadata about metrics
             "_metrics": {
                 "reden": "Formal podium speeches only",
@@ -1016,77 +1203,49 @@ class ExportMixin:
         Aggregates topic noun counts from all speeches by party.
         Returns per-1000 word frequencies for each policy topic.
         """
-        import re
-        from collections import Counter
-        from noun_analysis.lexicons import TOPIC_LEXICONS, TopicCategory
-
-        # Build word-to-topic lookup
-        word_to_topic: dict[str, str] = {}
-        for topic, words in TOPIC_LEXICONS.items():
-            for word in words:
-                word_to_topic[word] = topic.value
-
-        topic_set = set(word_to_topic.keys())
-        word_pattern = re.compile(r'\b[a-zäöüß]{4,}\b')
-        topic_names = [t.value for t in TopicCategory]
-
-        # Count topics per party
-        party_topic_counts: dict[str, dict[str, int]] = {}
-        party_word_counts: dict[str, int] = {}
-
-        for speech in self.all_speeches:
-            party = speech.get("party", "")
-            text = speech.get("text", "").lower()
-            if not party or not text:
-                continue
+        from .speaker_export.constants import TOPIC_NAMES
 
-            if party not in party_topic_counts:
-                party_topic_counts[party] = {t: 0 for t in topic_names}
-                party_word_counts[party] = 0
+        n_topics = len(TOPIC_NAMES)
 
-            words = word_pattern.findall(text)
-            party_word_counts[party] += len(words)
+        # Topic counts per party, as int arrays indexed by topic id
+        party_topic_counts: dict[str, np.ndarray] = {}
+        party_word_counts: dict[str, int] = {}
 
-            for word in words:
-                if word in topic_set:
-                    topic = word_to_topic[word]
-                    party_topic_counts[party][topic] += 1
+        for party, (word_count, topic_counts) in self._party_topic_counts.items():
+            party_word_counts[party] = word_count
+            party_topic_counts[party] = topic_counts
 
         # Calculate per-1000 frequencies
         party_scores: dict[str, dict[str, float]] = {}
-        for party in party_topic_counts:
+        for party, counts in party_topic_counts.items():
             total_words = party_word_counts.get(party, 0)
             if total_words == 0:
                 continue
             party_scores[party] = {
                 topic: round((count / total_words) * 1000, 2)
-                for topic, count in party_topic_counts[party].items()
+                for topic, count in zip(TOPIC_NAMES, counts.tolist())
             }
 
         # Find top topics overall (across all parties)
-        bundestag_totals: dict[str, int] = {t: 0 for t in topic_names}
-        for counts in party_topic_counts.values():
-            for topic, count in counts.items():
-                bundestag_totals[topic] += count
+        if party_topic_counts:
+            bundestag_totals = np.sum(np.stack(list(party_topic_counts.values())), axis=0)
+        else:
+            bundestag_totals = np.zeros(n_topics, dtype=np.int64)
 
         total_all_words = sum(party_word_counts.values())
         bundestag_scores = {
             topic: round((count / total_all_words) * 1000, 2) if total_all_words > 0 else 0
-            for topic, count in bundestag_totals.items()
+            for topic, count in zip(TOPIC_NAMES, bundestag_totals.tolist())
         }
 
         # Rank topics
-        sorted_topics = sorted(
-            bundestag_scores.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        top_topics = heapq.nlargest(6, bundestag_scores.items(), key=itemgetter(1))
 
         return {
             "byParty": party_scores,
             "overall": bundestag_scores,
             "topTopics": [
                 {"topic": topic, "score": score, "rank": i + 1}
-                for i, (topic, score) in enumerate(sorted_topics[:6])
+                for i, (topic, score) in enumerate(top_topics)
             ],
         }
@@ -6,16 +6,17 @@ plus heuristics for unknown names and support for custom overrides.
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Iterable, Literal, TextIO
 import json
 import logging
+import weakref
 
 Gender = Literal["male", "female", "unknown"]
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GenderResult:
     """Result of gender detection."""
 
@@ -24,6 +25,16 @@ class GenderResult:
     source: str  # "dictionary", "manual", "heuristic", "unknown"
 
 
+# Shared results for the fixed outcomes, so detection does not allocate them per call
+_EMPTY_RESULT = GenderResult("unknown", 0.0, "empty")
+_UNKNOWN_RESULT = GenderResult("unknown", 0.0, "unknown")
+_HEURISTIC_FAILED_RESULT = GenderResult("unknown", 0.0, "heuristic_failed")
+_FEMALE_ENDING_RESULT = GenderResult("female", 0.8, "heuristic")
+_MALE_ENDING_RESULT = GenderResult("male", 0.8, "heuristic")
+_FEMALE_A_RESULT = GenderResult("female", 0.65, "heuristic")
+_MALE_O_RESULT = GenderResult("male", 0.65, "heuristic")
+
+
 class GenderDetector:
     """Detect gender from German first names.
 
@@ -36,7 +47,7 @@ class GenderDetector:
 
     # Common German male first names
     # Compiled from Bundestag member lists and common German names
-    MALE_NAMES: set[str] = {
+    MALE_NAMES: frozenset[str] = frozenset({
         # A
         "achim", "adalbert", "adam", "adrian", "albrecht", "alexander", "alexej",
         "alfons", "alfred", "ali", "alois", "amin", "andreas", "andrej", "andrew",
@@ -119,10 +130,10 @@ class GenderDetector:
         "wolfram",
         # X-Z
         "xaver", "yannick", "yorick", "yusuf", "zeki",
-    }
+    })
 
     # Common German female first names
-    FEMALE_NAMES: set[str] = {
+    FEMALE_NAMES: frozenset[str] = frozenset({
         # A
         "agnieszka", "agnes", "alexandra", "alice", "alina", "aline", "almut",
         "amelie", "andrea", "angela", "angelika", "anika", "anja", "anke", "anna",
@@ -198,10 +209,10 @@ class GenderDetector:
         "waltraud", "wencke", "wiebke", "wilhelmine",
         # Y-Z
         "yasmin", "yvonne", "zaklin", "zita", "zoe",
-    }
+    })
 
     # Names that can be used for both genders (in German context)
-    AMBIGUOUS_NAMES: set[str] = {
+    AMBIGUOUS_NAMES: frozenset[str] = frozenset({
         "kim",
         "dominique",
         "robin",
@@ -214,7 +225,7 @@ class GenderDetector:
         "toni",
         "kerstin",  # Rare male variant exists
         "marion",  # Rare male variant (French)
-    }
+    })
 
     # Manual overrides for known Bundestag members with ambiguous/international names
     BUNDESTAG_OVERRIDES: dict[str, Gender] = {
@@ -296,6 +307,17 @@ class GenderDetector:
         "sieghard": "male",  # Sieghard Knodel
     }
 
+    # Name endings for the heuristic fallback (female endings are checked first)
+    FEMALE_ENDINGS: tuple[str, ...] = (
+        "ine", "ina", "ella", "ette", "ika",
+        "heid", "gard", "traud", "trud", "linde", "hilde",
+    )
+    MALE_ENDINGS: tuple[str, ...] = (
+        "bert", "brecht", "fried", "hard", "hart", "helm", "hold",
+        "mar", "mut", "olf", "wald", "ward", "win", "rich",
+        "ian", "ius", "us",
+    )
+
     def __init__(
         self,
         custom_mappings: dict[str, Gender] | None = None,
@@ -307,12 +329,15 @@ class GenderDetector:
             custom_mappings: Override dict for specific names (full first name -> gender)
             unknown_log_path: Path to log unknown names for manual review
         """
-        self._custom_mappings = custom_mappings or {}
+        self._custom_mappings = {k.lower(): v for k, v in (custom_mappings or {}).items()}
         self._unknown_log_path = unknown_log_path
+        self._unknown_log_file: TextIO | None = None
         self._cache: dict[str, GenderResult] = {}
+        # Results without the ending heuristics (see detect(heuristic=False))
+        self._dictionary_cache: dict[str, GenderResult] = {}
         self._unknown_names: set[str] = set()
 
-    def detect(self, first_name: str) -> GenderResult:
+    def detect(self, first_name: str, *, heuristic: bool = True) -> GenderResult:
         """Detect gender from first name.
 
         Uses multiple sources in order:
@@ -324,29 +349,55 @@ class GenderDetector:
 
         Args:
             first_name: The first name to analyze
+            heuristic: If False, skip step 4 and report names missing from
+                the mappings and dictionaries as unknown
 
         Returns:
             GenderResult with gender, confidence, and source
         """
         if not first_name:
-            return GenderResult("unknown", 0.0, "empty")
+            return _EMPTY_RESULT
 
         # Handle compound first names - use the first part
-        name_parts = first_name.strip().split()
-        primary_name = name_parts[0].lower() if name_parts else ""
-
-        if not primary_name:
-            return GenderResult("unknown", 0.0, "empty")
+        name_parts = first_name.split(None, 1)
+        if not name_parts:
+            return _EMPTY_RESULT
+        primary_name = name_parts[0].lower()
 
         # Check cache first
-        if primary_name in self._cache:
-            return self._cache[primary_name]
-
-        result = self._detect_uncached(primary_name)
-        self._cache[primary_name] = result
+        cache = self._cache if heuristic else self._dictionary_cache
+        result = cache.get(primary_name)
+        if result is None:
+            result = cache[primary_name] = self._detect_uncached(primary_name, heuristic)
         return result
 
-    def _detect_uncached(self, name_lower: str) -> GenderResult:
+    def detect_many(
+        self, first_names: Iterable[str], *, heuristic: bool = True
+    ) -> list[GenderResult]:
+        """Detect gender for many first names at once.
+
+        Same results as calling detect() per name, but each distinct input
+        is normalized and looked up only once.
+
+        Args:
+            first_names: First names to analyze (duplicates allowed)
+            heuristic: Passed through to detect()
+
+        Returns:
+            GenderResult per input name, in input order
+        """
+        detect = self.detect
+        seen: dict[str, GenderResult] = {}
+        seen_get = seen.get
+        results = []
+        for first_name in first_names:
+            result = seen_get(first_name)
+            if result is None:
+                result = seen[first_name] = detect(first_name, heuristic=heuristic)
+            results.append(result)
+        return results
+
+    def _detect_uncached(self, name_lower: str, heuristic: bool = True) -> GenderResult:
         """Internal detection without caching."""
         # 1. Check custom mappings (from file)
         if name_lower in self._custom_mappings:
@@ -356,33 +407,22 @@ class GenderDetector:
                 "manual",
             )
 
-        # 2. Check Bundestag-specific overrides
-        if name_lower in self.BUNDESTAG_OVERRIDES:
-            return GenderResult(
-                self.BUNDESTAG_OVERRIDES[name_lower],
-                0.9,
-                "bundestag_override",
-            )
-
-        # 3. Check built-in dictionaries
-        is_ambiguous = name_lower in self.AMBIGUOUS_NAMES
-
-        if name_lower in self.FEMALE_NAMES:
-            confidence = 0.7 if is_ambiguous else 0.95
-            return GenderResult("female", confidence, "dictionary")
-
-        if name_lower in self.MALE_NAMES:
-            confidence = 0.7 if is_ambiguous else 0.95
-            return GenderResult("male", confidence, "dictionary")
+        # 2.-3. Check Bundestag-specific overrides, then built-in dictionaries
+        result = _NAME_RESULTS.get(name_lower)
+        if result is not None:
+            return result
 
-        # 4. Try heuristics for German names
+        # 4. Try heuristics for German names (skipped names are not
+        # logged: the heuristic might still classify them)
+        if not heuristic:
+            return _UNKNOWN_RESULT
         result = self._heuristic_detect(name_lower)
         if result.confidence >= 0.6:
             return result
 
         # 5. Mark as unknown and log
         self._log_unknown(name_lower)
-        return GenderResult("unknown", 0.0, "unknown")
+        return _UNKNOWN_RESULT
 
     def _heuristic_detect(self, name: str) -> GenderResult:
         """Apply German naming heuristics based on common endings.
@@ -391,32 +431,22 @@ class GenderDetector:
         - Female: -a, -e (except diminutives), -ine, -ina, -ella, -ette, -ie
         - Male: -o, -us, -ian, -er, -ert, -olf, -ald, -hard, -helm, -bert, -fried
         """
-        # Female endings (more specific first)
-        female_endings = (
-            "ine", "ina", "ella", "ette", "ina", "ika", "ika",
-            "heid", "gard", "traud", "trud", "linde", "hilde",
-        )
-        if name.endswith(female_endings):
-            return GenderResult("female", 0.8, "heuristic")
-
-        # Male endings (more specific first)
-        male_endings = (
-            "bert", "brecht", "fried", "hard", "hart", "helm", "hold",
-            "mar", "mut", "olf", "wald", "ward", "win", "rich",
-            "ian", "ius", "us",
-        )
-        if name.endswith(male_endings):
-            return GenderResult("male", 0.8, "heuristic")
-
-        # Less specific endings
-        if name.endswith("a") and not name.endswith(("ska", "ka")):
+        if name.endswith(self.FEMALE_ENDINGS):
+            return _FEMALE_ENDING_RESULT
+
+        if name.endswith(self.MALE_ENDINGS):
+            return _MALE_ENDING_RESULT
+
+        # Less specific endings ("ska" already ends in "ka")
+        last = name[-1:]
+        if last == "a" and name[-2:] != "ka":
             # -a is typically female in German (except Slavic -ska)
-            return GenderResult("female", 0.65, "heuristic")
+            return _FEMALE_A_RESULT
 
-        if name.endswith("o"):
-            return GenderResult("male", 0.65, "heuristic")
+        if last == "o":
+            return _MALE_O_RESULT
 
-        return GenderResult("unknown", 0.0, "heuristic_failed")
+        return _HEURISTIC_FAILED_RESULT
 
     def _log_unknown(self, name: str) -> None:
         """Log unknown name for manual review."""
@@ -426,11 +456,20 @@ class GenderDetector:
 
             if self._unknown_log_path:
                 try:
-                    with open(self._unknown_log_path, "a", encoding="utf-8") as f:
-                        f.write(f"{name}\n")
+                    # Opened once on the first unknown name and kept for buffered writes
+                    if self._unknown_log_file is None:
+                        self._unknown_log_file = open(self._unknown_log_path, "a", encoding="utf-8")
+                        weakref.finalize(self, self._unknown_log_file.close)
+                    self._unknown_log_file.write(f"{name}\n")
                 except IOError as e:
                     logger.warning(f"Failed to write unknown name to log: {e}")
 
+    def close(self) -> None:
+        """Flush and close the unknown-name log file, if it was opened."""
+        if self._unknown_log_file is not None:
+            self._unknown_log_file.close()
+            self._unknown_log_file = None
+
     def get_unknown_names(self) -> set[str]:
         """Return set of names that couldn't be classified."""
         return self._unknown_names.copy()
@@ -445,6 +484,7 @@ class GenderDetector:
         self._custom_mappings[name.lower()] = gender
         # Clear from cache to use new mapping
         self._cache.pop(name.lower(), None)
+        self._dictionary_cache.pop(name.lower(), None)
         # Remove from unknown if previously logged
         self._unknown_names.discard(name.lower())
 
@@ -455,11 +495,36 @@ class GenderDetector:
             "female_names_count": len(self.FEMALE_NAMES),
             "ambiguous_names_count": len(self.AMBIGUOUS_NAMES),
             "custom_mappings_count": len(self._custom_mappings),
-            "cached_results": len(self._cache),
+            "cached_results": len(self._cache) + len(self._dictionary_cache),
             "unknown_names": len(self._unknown_names),
         }
 
 
+def _merge_name_tables() -> dict[str, GenderResult]:
+    """Merge the built-in name tables into one precedence-applied lookup.
+
+    Later sources overwrite earlier ones: male names, female names, then
+    Bundestag overrides. Results are shared, so hits allocate nothing.
+    """
+    merged: dict[str, GenderResult] = {}
+    for gender, names in (("male", GenderDetector.MALE_NAMES), ("female", GenderDetector.FEMALE_NAMES)):
+        result = GenderResult(gender, 0.95, "dictionary")
+        ambiguous_result = GenderResult(gender, 0.7, "dictionary")
+        for name in names:
+            merged[name] = ambiguous_result if name in GenderDetector.AMBIGUOUS_NAMES else result
+
+    override_results = {
+        gender: GenderResult(gender, 0.9, "bundestag_override")
+        for gender in set(GenderDetector.BUNDESTAG_OVERRIDES.values())
+    }
+    for name, gender in GenderDetector.BUNDESTAG_OVERRIDES.items():
+        merged[name] = override_results[gender]
+    return merged
+
+
+_NAME_RESULTS = _merge_name_tables()
+
+
 def load_custom_mappings(path: Path) -> dict[str, Gender]:
     """Load custom name->gender mappings from JSON file.
 
@@ -9,12 +9,15 @@ Framing (discriminatory) is shown separately, not competing in the ranking.
 """
 
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Callable
 
+import numpy as np
+
 from ..categorizer import ToneScores
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TraitCategory:
     """A tone analysis category."""
 
@@ -100,19 +103,35 @@ DEFAULT_CATEGORY = TraitCategory(
     description="Ausgewogenes Kommunikationsprofil",
 )
 
+# Extra trait, only ranked when parties' inclusivity scores differ
+INCLUSIVITY_CATEGORY = TraitCategory(
+    id="inclusivity",
+    name="Inklusiv",
+    emoji="🤗",
+    description="Höchste Inklusivität (Pronomen)",
+)
+
+
+# ToneScores field each category is ranked on
+_SCORE_ACCESSORS: dict[str, Callable[[ToneScores], float]] = {
+    "aggression": attrgetter("aggression_index"),
+    "discriminatory": attrgetter("discriminatory_index"),
+    "demand_intensity": attrgetter("demand_intensity"),
+    "collaboration": attrgetter("collaboration_score"),
+    "solution_focus": attrgetter("solution_focus"),
+    "affirmative": attrgetter("affirmative_score"),
+    "inclusivity": attrgetter("inclusivity_index"),
+}
+
+
+def _no_score(scores: ToneScores) -> float:
+    """Score for categories without a ToneScores field."""
+    return 0.0
+
 
 def _get_score_accessor(category_id: str) -> Callable[[ToneScores], float]:
     """Get the score accessor function for a category."""
-    accessors = {
-        "aggression": lambda s: s.aggression_index,
-        "discriminatory": lambda s: s.discriminatory_index,
-        "demand_intensity": lambda s: s.demand_intensity,
-        "collaboration": lambda s: s.collaboration_score,
-        "solution_focus": lambda s: s.solution_focus,
-        "affirmative": lambda s: s.affirmative_score,
-        "inclusivity": lambda s: s.inclusivity_index,
-    }
-    return accessors.get(category_id, lambda s: 0.0)
+    return _SCORE_ACCESSORS.get(category_id, _no_score)
 
 
 def compute_party_rankings(
@@ -133,32 +152,49 @@ def compute_party_rankings(
     if categories is None:
         categories = TONE_CATEGORIES
 
-    rankings: dict[str, dict[str, tuple[int, float]]] = {
-        party: {} for party in all_party_scores
+    parties = list(all_party_scores)
+    cat_ids = list(categories)
+    if not parties or not cat_ids:
+        return {party: {} for party in parties}
+
+    # Read every score once into a (parties x categories) matrix
+    score_fns = [_get_score_accessor(cat_id) for cat_id in cat_ids]
+    values = [[score_fn(scores) for score_fn in score_fns] for scores in all_party_scores.values()]
+    matrix = np.array(values, dtype=np.float64)
+
+    # Rank each column by score descending (highest = rank 1); the stable
+    # sort keeps ties in party order, like list.sort(reverse=True)
+    order = np.argsort(-matrix, axis=0, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, len(parties) + 1)[:, None], axis=0)
+    ranks_list = ranks.tolist()
+
+    return {
+        party: {
+            cat_id: (ranks_list[i][j], values[i][j])
+            for j, cat_id in enumerate(cat_ids)
+        }
+        for i, party in enumerate(parties)
     }
 
-    for cat_id in categories:
-        score_fn = _get_score_accessor(cat_id)
 
-        # Get all parties' scores for this category
-        party_scores = [
-            (party, score_fn(scores))
-            for party, scores in all_party_scores.items()
-        ]
+def get_trait_categories(all_party_scores: dict[str, ToneScores]) -> dict[str, TraitCategory]:
+    """Get the categories traits are ranked on for these parties.
 
-        # Sort by score descending (highest = rank 1)
-        party_scores.sort(key=lambda x: x[1], reverse=True)
-
-        # Assign ranks
-        for rank, (party, score) in enumerate(party_scores, start=1):
-            rankings[party][cat_id] = (rank, score)
-
-    return rankings
+    Tone categories, plus inclusivity if there's meaningful variance
+    (not all parties at the same value).
+    """
+    all_categories = dict(TONE_CATEGORIES)
+    inclusivity_scores = {s.inclusivity_index for s in all_party_scores.values()}
+    if len(inclusivity_scores) > 1:
+        all_categories["inclusivity"] = INCLUSIVITY_CATEGORY
+    return all_categories
 
 
 def classify_party_by_rank(
     party: str,
-    all_party_scores: dict[str, ToneScores]
+    all_party_scores: dict[str, ToneScores],
+    rankings: dict[str, dict[str, tuple[int, float]]] | None = None,
 ) -> tuple[TraitCategory, int, float]:
     """Classify a party based on which TONE category they rank #1 in.
 
@@ -168,21 +204,25 @@ def classify_party_by_rank(
     Args:
         party: Party name to classify
         all_party_scores: All parties' ToneScores for comparison
+        rankings: Precomputed compute_party_rankings() result covering at
+            least TONE_CATEGORIES (computed here if omitted)
 
     Returns:
         Tuple of (category, rank, score) for the party's best TONE category
     """
     # Only rank on Tonalität categories (not Framing)
-    rankings = compute_party_rankings(all_party_scores, TONE_CATEGORIES)
+    if rankings is None:
+        rankings = compute_party_rankings(all_party_scores, TONE_CATEGORIES)
     party_rankings = rankings.get(party, {})
+    tone_cat_ids = [c for c in party_rankings if c in TONE_CATEGORIES]
 
-    if not party_rankings:
+    if not tone_cat_ids:
         return DEFAULT_CATEGORY, 0, 0.0
 
     # Find category where this party has the best rank
     # Tie-breaker: higher absolute score
     best_cat_id = min(
-        party_rankings.keys(),
+        tone_cat_ids,
         key=lambda c: (party_rankings[c][0], -party_rankings[c][1])
     )
 
@@ -197,27 +237,19 @@ def get_party_traits(
     scores: ToneScores,
     all_party_scores: dict[str, ToneScores],
     top_n: int = 3,
+    rankings: dict[str, dict[str, tuple[int, float]]] | None = None,
 ) -> list[str]:
     """Get the top N distinguishing traits for a party.
 
     Only includes traits where the party ranks #1 or #2.
     Uses relative rankings, not absolute deviation from midpoint.
+    Pass rankings over get_trait_categories() to reuse them across parties.
     """
-    # Start with core tone categories
-    all_categories = dict(TONE_CATEGORIES)
-
-    # Only include inclusivity if there's meaningful variance (not all defaults)
-    inclusivity_scores = [s.inclusivity_index for s in all_party_scores.values()]
-    if len(set(inclusivity_scores)) > 1:  # Not all the same value
-        all_categories["inclusivity"] = TraitCategory(
-            id="inclusivity",
-            name="Inklusiv",
-            emoji="🤗",
-            description="Höchste Inklusivität (Pronomen)",
-        )
+    all_categories = get_trait_categories(all_party_scores)
 
     # Compute rankings across all parties
-    rankings = compute_party_rankings(all_party_scores, all_categories)
+    if rankings is None:
+        rankings = compute_party_rankings(all_party_scores, all_categories)
     party_rankings = rankings.get(party, {})
     n_parties = len(all_party_scores)
 
@@ -269,7 +301,8 @@ class PartyProfile:
 def build_party_profile(
     party: str,
     scores: ToneScores,
-    all_party_scores: dict[str, ToneScores]
+    all_party_scores: dict[str, ToneScores],
+    rankings: dict[str, dict[str, tuple[int, float]]] | None = None,
 ) -> PartyProfile:
     """Build a complete party profile from tone scores.
 
@@ -277,12 +310,17 @@ def build_party_profile(
         party: Party name
         scores: ToneScores for this party
         all_party_scores: All parties' scores for ranking comparison
+        rankings: Precomputed rankings over get_trait_categories()
+            (computed here if omitted)
 
     Returns:
         Complete PartyProfile with category, rank, and traits
     """
-    category, rank, score = classify_party_by_rank(party, all_party_scores)
-    traits = get_party_traits(party, scores, all_party_scores, top_n=3)
+    # Trait categories include every tone category, so one ranking serves both
+    if rankings is None:
+        rankings = compute_party_rankings(all_party_scores, get_trait_categories(all_party_scores))
+    category, rank, score = classify_party_by_rank(party, all_party_scores, rankings)
+    traits = get_party_traits(party, scores, all_party_scores, top_n=3, rankings=rankings)
 
     return PartyProfile(
         party=party,
@@ -295,6 +333,22 @@ def build_party_profile(
     )
 
 
+def build_party_profiles(all_party_scores: dict[str, ToneScores]) -> dict[str, PartyProfile]:
+    """Build profiles for all parties, ranking them only once.
+
+    Args:
+        all_party_scores: Dict mapping party name to ToneScores
+
+    Returns:
+        Dict mapping party name to PartyProfile, in input order
+    """
+    rankings = compute_party_rankings(all_party_scores, get_trait_categories(all_party_scores))
+    return {
+        party: build_party_profile(party, scores, all_party_scores, rankings)
+        for party, scores in all_party_scores.items()
+    }
+
+
 # Legacy aliases for backwards compatibility
 PartyArchetype = TraitCategory
 TRAIT_ARCHETYPES = TRAIT_CATEGORIES
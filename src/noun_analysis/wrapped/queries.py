@@ -1,7 +1,12 @@
 """Analytics query methods for wrapped analysis (mixin class)."""
 
-import math
+import heapq
 from collections import Counter
+from functools import cached_property
+from operator import itemgetter
+
+import numpy as np
+import pandas as pd
 
 # Event-specific words to exclude from distinctive word calculations
 # These skew statistics due to specific debates (e.g., Afghanistan/Ortskräfte debate)
@@ -24,10 +29,89 @@ PARTY_STOPWORDS = {
     "spd-geführt", "cdu-geführt", "grün-geführt",
 }
 
+# Both stopword lists, for a single isin() pass per word type
+_QUERY_STOPWORDS = frozenset(EVENT_STOPWORDS | PARTY_STOPWORDS)
+
+
+def _top_indices(values: np.ndarray, candidates: np.ndarray, n: int) -> np.ndarray:
+    """Get the candidate indices with the n largest values, largest first.
+
+    Same result as DataFrame.nlargest(n, keep="first") (ties keep row order),
+    but np.partition finds the cut-off so only the top n are sorted.
+    """
+    if n <= 0:
+        return candidates[:0]
+    sub = values[candidates]
+    if len(sub) > n:
+        cutoff = np.partition(sub, len(sub) - n)[len(sub) - n]
+        keep = sub > cutoff
+        # Fill the remaining slots with the earliest rows tied at the cut-off
+        keep[np.flatnonzero(sub == cutoff)[:n - np.count_nonzero(keep)]] = True
+        candidates = candidates[keep]
+        sub = sub[keep]
+    return candidates[np.argsort(-sub, kind="stable")]
+
+
+# (speakers, parties, total_words, speech_counts)
+_SpeakerColumns = tuple[list[str], list[str], np.ndarray, np.ndarray]
+
+
+def _speaker_columns(agg: dict[str, list]) -> _SpeakerColumns:
+    """Split {speaker: [party, total_words, speech_count]} into parallel columns."""
+    speakers = list(agg)
+    parties = [entry[0] for entry in agg.values()]
+    words = np.fromiter((entry[1] for entry in agg.values()), dtype=np.int64, count=len(agg))
+    counts = np.fromiter((entry[2] for entry in agg.values()), dtype=np.int64, count=len(agg))
+    return speakers, parties, words, counts
+
+
+def _word_ratios(df: pd.DataFrame, parties: list[str]) -> dict[str, tuple[float, np.ndarray]]:
+    """Compute _party_word_ratios for one word frequency frame."""
+    columns = set(df.columns)
+    compared = [p for p in parties if f"{p}_per1000" in columns]
+    ratios = {}
+
+    for col in df.columns:
+        party = col.removesuffix("_count")
+        if party == col or f"{party}_per1000" not in columns:
+            continue
+        other_cols = [f"{p}_per1000" for p in compared if p != party]
+        if not other_cols:
+            continue
+        # Calculate 0.05% minimum count (scales with party's total words)
+        min_count = df[col].sum() * 0.0005  # 0.05%
+        others_avg = df[other_cols].mean(axis=1).to_numpy()
+        ratio = df[f"{party}_per1000"].to_numpy(dtype=np.float64) / (others_avg + 0.001)
+        ratios[party] = (min_count, ratio)
+    return ratios
+
 
 class WrappedDataQueries:
     """Mixin providing all get_* query methods for WrappedData."""
 
+    @cached_property
+    def _not_stopword_masks(self) -> dict[str, np.ndarray]:
+        """Per word type, a boolean row mask that is False for stopwords."""
+        return {
+            word_type: ~df["word"].isin(_QUERY_STOPWORDS).to_numpy()
+            for word_type, df in self.word_frequencies.items()
+        }
+
+    @cached_property
+    def _party_word_ratios(self) -> dict[str, dict[str, tuple[float, np.ndarray]]]:
+        """Each party's minimum word count and per-word frequency ratio vs other parties.
+
+        Computed once per word type and shared by the word queries. Parties
+        missing frequency columns, or with no other party to compare
+        against, are left out.
+
+        Returns: {word_type: {party: (min_count, ratio array aligned with the rows)}}
+        """
+        return {
+            word_type: _word_ratios(df, self.metadata["parties"])
+            for word_type, df in self.word_frequencies.items()
+        }
+
     def get_distinctive_words(
         self, party: str, word_type: str = "nouns", top_n: int = 5
     ) -> list[tuple[str, float]]:
@@ -49,34 +133,23 @@ class WrappedDataQueries:
         if party_col not in df.columns or party_count_col not in df.columns:
             return []
 
-        other_parties = [p for p in self.metadata["parties"] if p != party]
-        other_cols = [f"{p}_per1000" for p in other_parties if f"{p}_per1000" in df.columns]
-
-        if not other_cols:
+        party_ratio = self._party_word_ratios[word_type].get(party)
+        if party_ratio is None:
             return []
 
-        # Calculate 0.05% minimum count (scales with party's total words)
-        total_words = df[party_count_col].sum()
-        min_count = total_words * 0.0005  # 0.05%
+        min_count, ratio = party_ratio
+        counts = df[party_count_col].to_numpy()
 
-        # Calculate ratio and balanced score
-        df = df.copy()
-        df["others_avg"] = df[other_cols].mean(axis=1)
-        df["ratio"] = df[party_col] / (df["others_avg"] + 0.001)
         # Balanced score: ratio × √per1000 (rewards both distinctiveness AND frequency)
-        df["score"] = df["ratio"] * df[party_col].apply(lambda x: math.sqrt(x))
+        score = ratio * np.sqrt(df[party_col].to_numpy(dtype=np.float64))
 
         # Filter: 0.05% min count, ratio > 2.0, exclude stopwords
-        distinctive = df[
-            (df[party_count_col] >= min_count) &
-            (df["ratio"] > 2.0) &
-            (~df["word"].isin(EVENT_STOPWORDS)) &
-            (~df["word"].isin(PARTY_STOPWORDS))
-        ]
+        mask = (counts >= min_count) & (ratio > 2.0) & self._not_stopword_masks[word_type]
         # Rank by balanced score
-        distinctive = distinctive.nlargest(top_n, "score")
+        top = _top_indices(score, np.flatnonzero(mask), top_n)
 
-        return [(row["word"], row["ratio"]) for _, row in distinctive.iterrows()]
+        words = df["word"].to_numpy()
+        return [(words[i], ratio[i].item()) for i in top]
 
     def get_key_topics(
         self, party: str, word_type: str = "nouns", top_n: int = 10
@@ -93,39 +166,24 @@ class WrappedDataQueries:
 
         df = self.word_frequencies[word_type]
         party_count_col = f"{party}_count"
-        party_freq_col = f"{party}_per1000"
 
         if party_count_col not in df.columns:
             return []
 
-        other_parties = [p for p in self.metadata["parties"] if p != party]
-        other_cols = [f"{p}_per1000" for p in other_parties if f"{p}_per1000" in df.columns]
-
-        if not other_cols:
+        party_ratio = self._party_word_ratios[word_type].get(party)
+        if party_ratio is None:
             return []
 
-        # Calculate 0.05% minimum count (scales with party's total words)
-        total_words = df[party_count_col].sum()
-        min_count = total_words * 0.0005  # 0.05%
-
-        df = df.copy()
-        df["others_avg"] = df[other_cols].mean(axis=1)
-        df["ratio"] = df[party_freq_col] / (df["others_avg"] + 0.001)
+        min_count, ratio = party_ratio
+        counts = df[party_count_col].to_numpy()
 
         # Filter: 0.05% min count, ratio > 1.5 (mild distinctiveness), exclude stopwords
-        key_topics = df[
-            (df[party_count_col] >= min_count) &
-            (df["ratio"] > 1.5) &
-            (~df["word"].isin(EVENT_STOPWORDS)) &
-            (~df["word"].isin(PARTY_STOPWORDS))
-        ]
+        mask = (counts >= min_count) & (ratio > 1.5) & self._not_stopword_masks[word_type]
         # Rank by count (most talked about), not ratio
-        key_topics = key_topics.nlargest(top_n * 2, party_count_col)
+        top = _top_indices(counts, np.flatnonzero(mask), top_n * 2)
 
-        results = [
-            (row["word"], int(row[party_count_col]), row["ratio"])
-            for _, row in key_topics.iterrows()
-        ]
+        words = df["word"].to_numpy()
+        results = [(words[i], int(counts[i]), ratio[i].item()) for i in top]
 
         # Filter out substring duplicates (e.g., "merz" when "friedrich merz" exists)
         # Keep the more specific (longer) version
@@ -170,13 +228,12 @@ class WrappedDataQueries:
 
     def get_top_speakers(self, n: int = 10) -> list[tuple[str, str, int]]:
         """Get top N speakers across all parties (formal speeches only)."""
-        all_speakers = []
-        for party, counts in self.speaker_stats.items():
-            for speaker, count in counts.items():
-                all_speakers.append((speaker, party, count))
-
-        all_speakers.sort(key=lambda x: x[2], reverse=True)
-        return all_speakers[:n]
+        all_speakers = (
+            (speaker, party, count)
+            for party, counts in self.speaker_stats.items()
+            for speaker, count in counts.items()
+        )
+        return heapq.nlargest(n, all_speakers, key=itemgetter(2))
 
     def get_formal_speakers(self, n: int = 10) -> list[tuple[str, str, int]]:
         """Get top N formal speech speakers (same as get_top_speakers)."""
@@ -184,26 +241,24 @@ class WrappedDataQueries:
 
     def get_question_time_speakers(self, n: int = 10) -> list[tuple[str, str, int]]:
         """Get top N question time participants."""
-        all_speakers = []
-        for party, counts in self.question_speaker_stats.items():
-            for speaker, count in counts.items():
-                all_speakers.append((speaker, party, count))
-
-        all_speakers.sort(key=lambda x: x[2], reverse=True)
-        return all_speakers[:n]
+        all_speakers = (
+            (speaker, party, count)
+            for party, counts in self.question_speaker_stats.items()
+            for speaker, count in counts.items()
+        )
+        return heapq.nlargest(n, all_speakers, key=itemgetter(2))
 
     def get_top_befragung_responders(self, n: int = 10) -> list[tuple[str, str, int]]:
         """Get top N speakers by Befragung/Fragestunde responses.
 
         These are typically government officials answering questions in Q&A sessions.
         """
-        all_speakers = []
-        for party, counts in self.befragung_speaker_stats.items():
-            for speaker, count in counts.items():
-                all_speakers.append((speaker, party, count))
-
-        all_speakers.sort(key=lambda x: x[2], reverse=True)
-        return all_speakers[:n]
+        all_speakers = (
+            (speaker, party, count)
+            for party, counts in self.befragung_speaker_stats.items()
+            for speaker, count in counts.items()
+        )
+        return heapq.nlargest(n, all_speakers, key=itemgetter(2))
 
     def get_party_champion(self, party: str) -> tuple[str, int] | None:
         """Get the most active speaker for a party."""
@@ -235,10 +290,10 @@ class WrappedDataQueries:
 
         # Filter to words discussed by 3+ parties
         # Sort by party_count DESC, then total_count DESC (tie-breaker)
-        hot = [(w, pc, word_total_count[w]) for w, pc in word_party_count.items() if pc >= 3]
-        hot.sort(key=lambda x: (x[1], x[2]), reverse=True)
+        hot = ((w, pc, word_total_count[w]) for w, pc in word_party_count.items() if pc >= 3)
+        top = heapq.nlargest(n, hot, key=itemgetter(1, 2))
 
-        return [w for w, _, _ in hot[:n]]
+        return [w for w, _, _ in top]
 
     def get_unique_speaker_count(self) -> int:
         """Get total number of unique speakers."""
@@ -276,8 +331,35 @@ class WrappedDataQueries:
         """Get speakers with the longest individual speeches."""
         if not self.all_speeches:
             return []
-        sorted_speeches = sorted(self.all_speeches, key=lambda x: x.get('words', 0), reverse=True)
-        return [(s['speaker'], s['party'], s['words']) for s in sorted_speeches[:n]]
+        longest = heapq.nlargest(n, self.all_speeches, key=lambda x: x.get('words', 0))
+        return [(s['speaker'], s['party'], s['words']) for s in longest]
+
+    @cached_property
+    def _speaker_agg(self) -> tuple[_SpeakerColumns, _SpeakerColumns]:
+        """Per-speaker (speakers, parties, total_words, speech_counts) columns.
+
+        Built in one pass over all_speeches. Returns (all speeches, formal
+        Reden only). Speakers are in order of first appearance and party is
+        the one from their latest speech.
+        """
+        all_agg: dict[str, list] = {}
+        rede_agg: dict[str, list] = {}
+
+        for s in self.all_speeches:
+            key = s['speaker']
+            party = s['party']
+            words = s.get('words', 0)
+            aggs = (all_agg, rede_agg) if s.get('type') == 'rede' else (all_agg,)
+            for agg in aggs:
+                entry = agg.get(key)
+                if entry is None:
+                    agg[key] = [party, words, 1]
+                else:
+                    entry[0] = party
+                    entry[1] += words
+                    entry[2] += 1
+
+        return _speaker_columns(all_agg), _speaker_columns(rede_agg)
 
     def get_verbose_speakers(self, n: int = 5, min_speeches: int = 5) -> list[tuple[str, str, float, int]]:
         """Get speakers with highest average words per speech.
@@ -287,23 +369,10 @@ class WrappedDataQueries:
         if not self.all_speeches:
             return []
 
-        speaker_words: dict = {}
-        speaker_counts: Counter = Counter()
-        speaker_party: dict = {}
-
-        for s in self.all_speeches:
-            key = s['speaker']
-            speaker_words[key] = speaker_words.get(key, 0) + s.get('words', 0)
-            speaker_counts[key] += 1
-            speaker_party[key] = s['party']
-
-        verbose = [
-            (speaker, speaker_party[speaker], speaker_words[speaker] / count, count)
-            for speaker, count in speaker_counts.items()
-            if count >= min_speeches
-        ]
-        verbose.sort(key=lambda x: x[2], reverse=True)
-        return verbose[:n]
+        speakers, parties, words, counts = self._speaker_agg[0]
+        avg = words / counts
+        top = _top_indices(avg, np.flatnonzero(counts >= min_speeches), n)
+        return [(speakers[i], parties[i], avg[i].item(), counts[i].item()) for i in top]
 
     def get_wordiest_speakers(self, n: int = 5) -> list[tuple[str, str, int, int]]:
         """Get speakers with most total words spoken.
@@ -313,22 +382,9 @@ class WrappedDataQueries:
         if not self.all_speeches:
             return []
 
-        speaker_words: dict = {}
-        speaker_counts: Counter = Counter()
-        speaker_party: dict = {}
-
-        for s in self.all_speeches:
-            key = s['speaker']
-            speaker_words[key] = speaker_words.get(key, 0) + s.get('words', 0)
-            speaker_counts[key] += 1
-            speaker_party[key] = s['party']
-
-        wordiest = [
-            (speaker, speaker_party[speaker], speaker_words[speaker], speaker_counts[speaker])
-            for speaker in speaker_words
-        ]
-        wordiest.sort(key=lambda x: x[2], reverse=True)
-        return wordiest[:n]
+        speakers, parties, words, counts = self._speaker_agg[0]
+        top = _top_indices(words, np.arange(len(speakers)), n)
+        return [(speakers[i], parties[i], words[i].item(), counts[i].item()) for i in top]
 
     def get_speakers_by_avg_words(
         self, n: int = 20, min_speeches: int = 5
@@ -346,34 +402,15 @@ class WrappedDataQueries:
         if not self.all_speeches:
             return []
 
-        speaker_words: dict = {}
-        speaker_counts: Counter = Counter()
-        speaker_party: dict = {}
-
-        for s in self.all_speeches:
-            # Only count formal Reden
-            if s.get('type') != 'rede':
-                continue
-            key = s['speaker']
-            speaker_words[key] = speaker_words.get(key, 0) + s.get('words', 0)
-            speaker_counts[key] += 1
-            speaker_party[key] = s['party']
-
-        speakers_with_avg = [
-            (
-                speaker,
-                speaker_party[speaker],
-                speaker_words[speaker] // speaker_counts[speaker],
-                speaker_words[speaker],
-                speaker_counts[speaker],
-            )
-            for speaker in speaker_words
-            if speaker_counts[speaker] >= min_speeches
+        # Only count formal Reden
+        speakers, parties, words, counts = self._speaker_agg[1]
+        avg = words // counts
+        top = _top_indices(avg, np.flatnonzero(counts >= min_speeches), n)
+        return [
+            (speakers[i], parties[i], avg[i].item(), words[i].item(), counts[i].item())
+            for i in top
         ]
 
-        speakers_with_avg.sort(key=lambda x: x[2], reverse=True)
-        return speakers_with_avg[:n]
-
     def get_party_top_speakers(self, party: str, n: int = 3) -> list[tuple[str, int]]:
         """Get top N speakers for a specific party."""
         if party not in self.speaker_stats:
@@ -406,17 +443,21 @@ class WrappedDataQueries:
         party_cols = [c for c in df.columns if c.endswith('_count')]
         result = {}
 
-        for col in party_cols:
+        # (words x parties) count matrix; a word is exclusive if only one party uses it
+        counts = df[party_cols].to_numpy()
+        used = counts != 0
+        parties_using = used.sum(axis=1)
+        words = df["word"].to_numpy()
+
+        for j, col in enumerate(party_cols):
             party = col.replace('_count', '')
+            col_counts = counts[:, j]
             # Find words where this party has min_count+ and others have 0
-            mask = (df[col] >= min_count)
-            for other_col in party_cols:
-                if other_col != col:
-                    mask = mask & (df[other_col] == 0)
-
-            exclusive = df[mask].nlargest(n, col)
-            if len(exclusive) > 0:
-                result[party] = [(row['word'], int(row[col])) for _, row in exclusive.iterrows()]
+            mask = (col_counts >= min_count) & (parties_using == used[:, j])
+
+            top = _top_indices(col_counts, np.flatnonzero(mask), n)
+            if len(top) > 0:
+                result[party] = [(words[i], int(col_counts[i])) for i in top]
 
         return result
 
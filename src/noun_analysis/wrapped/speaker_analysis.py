@@ -4,6 +4,8 @@ Provides comprehensive gender-based and speaker-based analysis queries
 for the Bundestag wrapped analysis.
 """
 
+import heapq
+from operator import itemgetter
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -134,12 +136,14 @@ class GenderAnalysisMixin:
         Returns:
             [(speaker_name, party, speech_count), ...]
         """
-        speakers = []
-        for profile in self.speaker_profiles.values():
-            if profile.gender == gender:
-                count = profile.formal_speeches if formal_only else profile.total_speeches
-                speakers.append((profile.name, profile.party, count))
-        return sorted(speakers, key=lambda x: x[2], reverse=True)[:n]
+        speakers = (
+            (profile.name, profile.party,
+             profile.formal_speeches if formal_only else profile.total_speeches)
+            for profile in self.speaker_profiles.values()
+            if profile.gender == gender
+        )
+        # Same result as a full sort + slice, ties included, in O(N log n)
+        return heapq.nlargest(n, speakers, key=itemgetter(2))
 
     def get_top_female_speakers(
         self, n: int = 10, formal_only: bool = False
@@ -31,6 +31,13 @@ for _topic, _topic_words in TOPIC_LEXICONS.items():
 # All topic nouns as a single set (for quick membership check)
 TOPIC_NOUN_SET: set[str] = set(TOPIC_WORD_TO_CATEGORY.keys())
 
+# Topic names in TopicCategory order, and each topic noun's index into that list
+# (for counting topics in integer arrays instead of per-topic dicts)
+TOPIC_NAMES: list[str] = [_topic.value for _topic in TopicCategory]
+TOPIC_WORD_TO_ID: dict[str, int] = {
+    _word: TOPIC_NAMES.index(_topic.value) for _word, _topic in TOPIC_WORD_TO_CATEGORY.items()
+}
+
 # Quiz distractor words (module-level constants to avoid recreation)
 WORD_DISTRACTORS = [
     'bundesregierung', 'gesetzentwurf', 'abstimmung', 'fraktion',
@@ -641,6 +641,7 @@ def load_wrapped_data(results_dir: Path, data_dir: Path, cls=None):
         gender_detector,
         drama_stats,
     )
+    gender_detector.close()
 
     # Merge last-name-only profiles into full profiles (e.g., "Kraft" -> "Dr. Konstantin von Notz")
     speaker_profiles = merge_partial_profiles(speaker_profiles)
@@ -0,0 +1,68 @@
+"""Tests for the Gemini API client."""
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from noun_analysis import gemini_service
+from noun_analysis.gemini_service import GeminiClient
+
+
+def sse_event(*texts):
+    """One server-sent event carrying a candidate with the given text parts."""
+    payload = {"candidates": [{"content": {"parts": [{"text": text} for text in texts]}}]}
+    return b"data: " + orjson.dumps(payload) + b"\r\n\r\n"
+
+
+def collect_stream(handler, **kwargs):
+    """Run generate_stream against a mocked transport and return its chunks."""
+
+    async def run():
+        client = GeminiClient(api_key="test-key")
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            return [chunk async for chunk in client.generate_stream("Prompt", **kwargs)]
+        finally:
+            await client._client.aclose()
+
+    return asyncio.run(run())
+
+
+class TestGenerateStream:
+    """Test SSE decoding and retries of GeminiClient.generate_stream."""
+
+    def test_yields_text_parts_in_order(self):
+        """Every text part of every event is yielded; other lines are ignored."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            body = b": keep-alive\r\n\r\n" + sse_event("[{", '"a": 1') + sse_event("}]", "")
+            return httpx.Response(200, content=body, headers={"Content-Type": "text/event-stream"})
+
+        chunks = collect_stream(handler, system_instruction="Be brief")
+
+        assert chunks == ["[{", '"a": 1', "}]"]
+        assert ":streamGenerateContent" in requests[0].url.path
+        assert requests[0].url.params["alt"] == "sse"
+        assert orjson.loads(requests[0].content)["systemInstruction"]
+
+    def test_rate_limit_is_retried(self, monkeypatch):
+        """A 429 before any output is retried after a backoff."""
+        responses = [httpx.Response(429), httpx.Response(200, content=sse_event("OK"))]
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(gemini_service.asyncio, "sleep", fake_sleep)
+
+        assert collect_stream(lambda request: responses.pop(0)) == ["OK"]
+        assert sleeps == [1]
+
+    def test_http_errors_are_raised(self):
+        """Non-retryable status codes surface as httpx errors."""
+        with pytest.raises(httpx.HTTPStatusError):
+            collect_stream(lambda request: httpx.Response(400))
@@ -0,0 +1,110 @@
+"""Tests for first-name gender detection."""
+
+import pytest
+
+from noun_analysis.wrapped.gender import GenderDetector
+
+
+class TestGenderDetector:
+    """Test lookup precedence and name normalization."""
+
+    def setup_method(self):
+        self.detector = GenderDetector()
+
+    @pytest.mark.parametrize("name, gender, confidence, source", [
+        ("Friedrich", "male", 0.95, "dictionary"),
+        ("Alice", "female", 0.95, "dictionary"),
+        ("Kerstin", "female", 0.7, "dictionary"),
+        ("Andrea", "female", 0.9, "bundestag_override"),
+        ("Sascha", "male", 0.9, "bundestag_override"),
+        ("Serdar", "male", 0.9, "bundestag_override"),
+        ("Gunhilde", "female", 0.8, "heuristic"),
+        ("Hartwin", "male", 0.8, "heuristic"),
+        ("Xyz", "unknown", 0.0, "unknown"),
+    ])
+    def test_lookup_precedence(self, name, gender, confidence, source):
+        """Overrides beat the dictionaries, which beat the ending heuristics."""
+        result = self.detector.detect(name)
+
+        assert (result.gender, result.confidence, result.source) == (gender, confidence, source)
+
+    def test_custom_mappings_win(self):
+        """Manual mappings override every built-in source."""
+        detector = GenderDetector(custom_mappings={"andrea": "male"})
+
+        result = detector.detect("Andrea")
+
+        assert (result.gender, result.source) == ("male", "manual")
+
+    def test_custom_mapping_keys_are_normalized(self):
+        """Custom mapping keys match regardless of their capitalization."""
+        detector = GenderDetector(custom_mappings={"Anna": "male"})
+
+        assert detector.detect("anna").source == "manual"
+
+    def test_builtin_tables_are_lowercase(self):
+        """Lookups use lowercased names, so built-in keys must be lowercase."""
+        for table in (
+            GenderDetector.MALE_NAMES,
+            GenderDetector.FEMALE_NAMES,
+            GenderDetector.AMBIGUOUS_NAMES,
+            GenderDetector.BUNDESTAG_OVERRIDES,
+        ):
+            assert all(name == name.lower() for name in table)
+
+    def test_compound_names_use_first_part(self):
+        """Only the first part of a compound first name is looked up."""
+        assert self.detector.detect("  Anna Lena ").gender == "female"
+        assert self.detector.detect("HANS Peter").gender == "male"
+
+    @pytest.mark.parametrize("name", ["", "   "])
+    def test_empty_names(self, name):
+        """Empty input is reported as unknown without a lookup."""
+        result = self.detector.detect(name)
+
+        assert (result.gender, result.source) == ("unknown", "empty")
+
+    def test_unknown_names_are_collected(self):
+        """Unclassifiable names are logged once and can be mapped later."""
+        self.detector.detect("Xyz")
+        assert self.detector.get_unknown_names() == {"xyz"}
+
+        self.detector.add_mapping("Xyz", "female")
+
+        assert self.detector.get_unknown_names() == set()
+        assert self.detector.detect("xyz").source == "manual"
+
+    def test_detect_many_matches_detect(self):
+        """Batch detection returns per-name results in input order."""
+        names = ["Alice", "Friedrich", "", "Alice", "Xyz", "Anna Lena"]
+
+        results = GenderDetector().detect_many(names)
+
+        assert results == [self.detector.detect(name) for name in names]
+
+    def test_unknown_names_are_written_to_log(self, tmp_path):
+        """Each unknown name is appended to the log file once."""
+        log_path = tmp_path / "unknown_names.txt"
+        detector = GenderDetector(unknown_log_path=log_path)
+
+        detector.detect_many(["Xyz", "Qwx", "Xyz Abc", "Alice"])
+        detector.close()
+
+        assert log_path.read_text(encoding="utf-8") == "xyz\nqwx\n"
+
+    def test_heuristic_can_be_skipped(self):
+        """Without heuristics, names outside the dictionaries are unknown."""
+        assert self.detector.detect("Gunhilde", heuristic=False).source == "unknown"
+        assert self.detector.detect("Gunhilde").source == "heuristic"
+        assert self.detector.detect("Alice", heuristic=False).source == "dictionary"
+
+    def test_skipped_heuristic_does_not_log_unknown(self, tmp_path):
+        """Names only unknown because the heuristic was skipped are not logged."""
+        log_path = tmp_path / "unknown_names.txt"
+        detector = GenderDetector(unknown_log_path=log_path)
+
+        detector.detect_many(["Gunhilde", "Xyz"], heuristic=False)
+        detector.close()
+
+        assert detector.get_unknown_names() == set()
+        assert not log_path.exists()
@@ -0,0 +1,414 @@
+"""Tests for the Gemini-based parser evaluation (extraction and matching)."""
+
+import asyncio
+
+import pytest
+from noun_analysis import parser_evaluation
+from noun_analysis.parser_evaluation import (
+    GeminiSpeech,
+    ParserEvaluator,
+    fuzzy_name_match,
+    levenshtein_distance,
+)
+
+
+def gemini_speech(speaker, party=None, role=None, text_preview=""):
+    """Build a GeminiSpeech with defaults for fields the matcher ignores."""
+    return GeminiSpeech(
+        speaker=speaker,
+        party=party,
+        role=role,
+        text_preview=text_preview,
+        start_marker="",
+        speech_type="formal_speech",
+    )
+
+
+class TestLevenshteinDistance:
+    """Test the bounded pure-Python Levenshtein fallback."""
+
+    @pytest.mark.parametrize("s1, s2, expected", [
+        ("", "", 0),
+        ("abc", "", 3),
+        ("weidel", "weidel", 0),
+        ("weidel", "weidl", 1),
+        ("kitten", "sitting", 3),
+        ("merz", "marz", 1),
+    ])
+    def test_distance_within_bound(self, s1, s2, expected):
+        """Distances up to max_distance are exact."""
+        assert levenshtein_distance(s1, s2, max_distance=3) == expected
+        assert levenshtein_distance(s2, s1, max_distance=3) == expected
+
+    def test_distance_above_bound_is_capped(self):
+        """Distances above max_distance are reported as max_distance + 1."""
+        assert levenshtein_distance("friedrich merz", "lars klingbeil", max_distance=3) == 4
+        assert levenshtein_distance("abcdefgh", "ab", max_distance=3) == 4
+
+    def test_zero_bound(self):
+        """max_distance=0 only accepts identical strings."""
+        assert levenshtein_distance("spd", "spd", max_distance=0) == 0
+        assert levenshtein_distance("spd", "sdp", max_distance=0) == 1
+
+
+class TestFuzzyNameMatch:
+    """Test fuzzy speaker name matching."""
+
+    def test_title_is_ignored(self):
+        """Academic titles do not prevent a match."""
+        assert fuzzy_name_match("Dr. Alice Weidel", "Alice Weidel")
+
+    def test_small_typo_matches(self):
+        """Names within the edit threshold match."""
+        assert fuzzy_name_match("Alice Weidel", "Alice Weidl")
+
+    def test_same_last_name_matches(self):
+        """Matching last names are treated as the same speaker."""
+        assert fuzzy_name_match("Friedrich Merz", "F. Merz")
+
+    def test_different_names_do_not_match(self):
+        """Unrelated names do not match."""
+        assert not fuzzy_name_match("Friedrich Merz", "Lars Klingbeil")
+
+
+class TestMatchSpeeches:
+    """Test pairing of Gemini and regex speeches."""
+
+    def setup_method(self):
+        self.evaluator = ParserEvaluator(gemini_client=None)
+
+    def test_matches_by_name_and_party(self):
+        """Speakers are paired by name and party regardless of order."""
+        gemini = [
+            gemini_speech("Lars Klingbeil", "SPD"),
+            gemini_speech("Dr. Alice Weidel", "AfD"),
+        ]
+        regex = [
+            {"speaker": "Alice Weidel", "party": "AfD", "text": ""},
+            {"speaker": "Lars Klingbeil", "party": "SPD", "text": ""},
+        ]
+        matches = self.evaluator.match_speeches(gemini, regex)
+
+        assert [m.match_type for m in matches] == ["exact", "exact"]
+        assert all(m.speaker_match and m.party_match for m in matches)
+
+    def test_similar_last_name_matches(self):
+        """A typo in the last name still pairs the speeches."""
+        gemini = [gemini_speech("Alice Weidl", "AfD")]
+        regex = [{"speaker": "Alice Weidel", "party": "AfD", "text": ""}]
+        matches = self.evaluator.match_speeches(gemini, regex)
+
+        assert [m.match_type for m in matches] == ["exact"]
+
+    def test_whole_name_distance_matches(self):
+        """Merged name tokens pair up via whole-name edit distance."""
+        gemini = [gemini_speech("Anna Maria Schmidt", "SPD")]
+        regex = [{"speaker": "Anna Mariaschmidt", "party": "SPD", "text": ""}]
+        matches = self.evaluator.match_speeches(gemini, regex)
+
+        assert [m.match_type for m in matches] == ["exact"]
+
+    def test_first_matching_speech_in_protocol_order_wins(self):
+        """An earlier fuzzy match beats a later same-last-name speech."""
+        gemini = [gemini_speech("Olaf Scholz", "SPD")]
+        regex = [
+            {"speaker": "Olaf Schulz", "party": "SPD", "text": ""},
+            {"speaker": "Olaf Scholz", "party": "SPD", "text": ""},
+        ]
+        matches = self.evaluator.match_speeches(gemini, regex)
+
+        assert matches[0].match_type == "exact"
+        assert matches[0].regex_speech is regex[0]
+
+    def test_government_official_without_party(self):
+        """Government officials match regardless of party."""
+        gemini = [gemini_speech("Friedrich Merz", role="Bundeskanzler")]
+        regex = [{"speaker": "Friedrich Merz", "party": "CDU/CSU", "text": ""}]
+        matches = self.evaluator.match_speeches(gemini, regex)
+
+        assert [m.match_type for m in matches] == ["exact"]
+
+    def test_unmatched_speeches_are_reported(self):
+        """Speeches without a counterpart end up as gemini_only/regex_only."""
+        gemini = [gemini_speech("Lars Klingbeil", "SPD", text_preview="Guten Morgen")]
+        regex = [{"speaker": "Tino Chrupalla", "party": "AfD", "text": "Ganz anderer Text"}]
+        matches = self.evaluator.match_speeches(gemini, regex)
+
+        assert sorted(m.match_type for m in matches) == ["gemini_only", "regex_only"]
+
+    def test_partial_match_by_text(self):
+        """Unmatched names fall back to text similarity."""
+        text = "Frau Präsidentin! Meine sehr verehrten Damen und Herren!"
+        gemini = [gemini_speech("Unbekannt", "SPD", text_preview=text)]
+        regex = [{"speaker": "Lars Klingbeil", "party": "SPD", "text": text}]
+        matches = self.evaluator.match_speeches(gemini, regex)
+
+        assert [m.match_type for m in matches] == ["partial"]
+        assert any("speaker mismatch" in issue for issue in matches[0].issues)
+
+
+HAUSHALT = (
+    "Frau Präsidentin! Meine sehr verehrten Damen und Herren! "
+    "Wir beraten heute den Haushalt für das kommende Jahr."
+)
+SIMILAR_TEXTS = {
+    # ~0.95 under both scorers: a duplicate and a text match
+    "near": (
+        "Frau Präsidentin! Meine sehr verehrten Damen und Herren! "
+        "Wir beraten heute den Haushalt für das nächste Jahr."
+    ),
+    # ~0.6 under both scorers: a text match, but no duplicate
+    "mid": (
+        "Frau Präsidentin! Meine Damen und Herren! "
+        "Heute geht es um die Rente und nicht um den Haushalt."
+    ),
+    # ~0.16 under both scorers: neither
+    "far": "Vielen Dank.",
+}
+
+
+@pytest.fixture(params=["rapidfuzz", "difflib"])
+def similarity_backend(request, monkeypatch):
+    """Run a test with rapidfuzz and again with the pure-Python fallbacks."""
+    if request.param == "difflib":
+        monkeypatch.setattr(parser_evaluation, "fuzz", None)
+        monkeypatch.setattr(parser_evaluation, "process", None)
+        monkeypatch.setattr(parser_evaluation, "Levenshtein", None)
+    return request.param
+
+
+class TestSimilarityBackends:
+    """Thresholded decisions must not depend on whether rapidfuzz is installed."""
+
+    def setup_method(self):
+        self.evaluator = ParserEvaluator(gemini_client=None)
+
+    @pytest.mark.parametrize("kind, expected", [
+        ("near", "partial"),
+        ("mid", "partial"),
+        ("far", "gemini_only"),
+    ])
+    def test_text_match_threshold(self, similarity_backend, kind, expected):
+        """Pass 2 pairs speeches above 0.5 text similarity only."""
+        gemini = [gemini_speech("Unbekannt", "SPD", text_preview=HAUSHALT)]
+        regex = [{"speaker": "Lars Klingbeil", "party": "SPD", "text": SIMILAR_TEXTS[kind]}]
+        matches = self.evaluator.match_speeches(gemini, regex)
+
+        assert matches[0].match_type == expected
+
+    @pytest.mark.parametrize("kind, expected", [
+        ("near", True),
+        ("mid", False),
+        ("far", False),
+    ])
+    def test_duplicate_threshold(self, similarity_backend, kind, expected):
+        """Same-speaker texts count as duplicates above 0.85 similarity only."""
+        speeches = [
+            {"speaker": "Lars Klingbeil", "text": HAUSHALT},
+            {"speaker": "Lars Klingbeil", "text": SIMILAR_TEXTS[kind]},
+        ]
+        assert bool(self.evaluator.detect_duplicates(speeches)) is expected
+
+    def test_duplicates_need_the_same_speaker(self, similarity_backend):
+        """Near-identical texts by different speakers are not duplicates."""
+        speeches = [
+            {"speaker": "Lars Klingbeil", "text": HAUSHALT},
+            {"speaker": "Alice Weidel", "text": SIMILAR_TEXTS["near"]},
+        ]
+        assert self.evaluator.detect_duplicates(speeches) == []
+
+    @pytest.mark.parametrize("name1, name2, expected", [
+        ("Anna Maria Schmidt", "Anna Mariaschmidt", True),
+        ("Friedrich Merz", "Lars Klingbeil", False),
+    ])
+    def test_name_distance_threshold(self, similarity_backend, name1, name2, expected):
+        """Whole-name edit distance is thresholded the same way."""
+        assert fuzzy_name_match(name1, name2) is expected
+
+
+class FakeGeminiClient:
+    """Records prompts and streams canned responses, repeating the last one."""
+
+    def __init__(self, *responses, chunk_size=7):
+        self.responses = list(responses)
+        self.chunk_size = chunk_size
+        self.prompts = []
+
+    async def generate_stream(self, prompt, model=None, system_instruction=None):
+        self.prompts.append(prompt)
+        response = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        for start in range(0, len(response), self.chunk_size):
+            yield response[start:start + self.chunk_size]
+
+
+class TestExtractBatch:
+    """Test batched Gemini extraction and caching."""
+
+    BATCH_RESPONSE = '{"0": [{"speaker": "Alice Weidel", "party": "AfD"}], "1": []}'
+
+    def test_small_protocols_share_one_request(self, tmp_path):
+        """Protocols within the character budget go out in a single request."""
+        client = FakeGeminiClient(self.BATCH_RESPONSE)
+        evaluator = ParserEvaluator(client, cache_dir=tmp_path)
+
+        results = asyncio.run(evaluator.extract_batch([("1", "Text eins"), ("2", "Text zwei")]))
+
+        assert len(client.prompts) == 1
+        assert [s.speaker for s in results[0]] == ["Alice Weidel"]
+        assert results[1] == []
+
+    def test_cached_protocols_are_not_requested_again(self, tmp_path):
+        """A second extraction is served from the cache."""
+        client = FakeGeminiClient(self.BATCH_RESPONSE)
+        evaluator = ParserEvaluator(client, cache_dir=tmp_path)
+        items = [("1", "Text eins"), ("2", "Text zwei")]
+
+        asyncio.run(evaluator.extract_batch(items))
+        results = asyncio.run(evaluator.extract_batch(items))
+
+        assert len(client.prompts) == 1
+        assert [s.speaker for s in results[0]] == ["Alice Weidel"]
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 1000])
+    def test_streamed_chunks_are_joined(self, chunk_size):
+        """The response is parsed the same however it is split into chunks."""
+        response = (
+            '[{"speaker": "Alice Weidel", "party": "AfD",'
+            ' "text_preview": "Sie sagen \\"[Nein]\\", {oder} \\\\?",'
+            ' "zwischenrufe": [{"text": "Hört, hört!", "party": "SPD"}]},'
+            ' {"speaker": "Lars Klingbeil", "party": "SPD"}]'
+        )
+        client = FakeGeminiClient(response, chunk_size=chunk_size)
+        evaluator = ParserEvaluator(client)
+
+        [speeches] = asyncio.run(evaluator.extract_batch([("1", "Text eins")]))
+
+        assert [s.speaker for s in speeches] == ["Alice Weidel", "Lars Klingbeil"]
+        assert speeches[0].text_preview == 'Sie sagen "[Nein]", {oder} \\?'
+        assert speeches[0].zwischenrufe == [{"text": "Hört, hört!", "party": "SPD"}]
+
+    @pytest.mark.parametrize("response", [
+        'Hier die Reden [vollständig]:\n```json\n[{"speaker": "Alice Weidel"}]\n```',
+        'Gerne, hier ist das Ergebnis:\n[{"speaker": "Alice Weidel"}]\nViel Erfolg!',
+    ])
+    def test_leading_preamble_is_skipped(self, response):
+        """Chatter before the JSON array, even with brackets, is ignored."""
+        evaluator = ParserEvaluator(FakeGeminiClient(response))
+
+        [speeches] = asyncio.run(evaluator.extract_batch([("1", "Text eins")]))
+
+        assert [s.speaker for s in speeches] == ["Alice Weidel"]
+
+    def test_truncated_stream_is_reported_and_not_cached(self, tmp_path, caplog):
+        """A cut-off response logs a warning and is requested again next time."""
+        client = FakeGeminiClient(
+            '[{"speaker": "Alice Weidel"}, {"speaker": "Lars Kl',
+            '[{"speaker": "Alice Weidel"}, {"speaker": "Lars Klingbeil"}]',
+        )
+        evaluator = ParserEvaluator(client, cache_dir=tmp_path)
+
+        with caplog.at_level("WARNING"):
+            first = asyncio.run(evaluator.extract_batch([("1", "Text eins")]))
+        second = asyncio.run(evaluator.extract_batch([("1", "Text eins")]))
+
+        assert first == [[]]
+        assert "Could not parse Gemini response for protocol 1" in caplog.text
+        assert [s.speaker for s in second[0]] == ["Alice Weidel", "Lars Klingbeil"]
+        assert len(client.prompts) == 2
+
+    def test_malformed_entries_are_logged(self, caplog):
+        """Entries that aren't speech objects are skipped with a warning."""
+        evaluator = ParserEvaluator(FakeGeminiClient('[{"speaker": "Alice Weidel"}, 5]'))
+
+        with caplog.at_level("WARNING"):
+            [speeches] = asyncio.run(evaluator.extract_batch([("1", "Text eins")]))
+
+        assert [s.speaker for s in speeches] == ["Alice Weidel"]
+        assert "Skipped 1 malformed speech entries" in caplog.text
+
+    def test_unparseable_response_yields_no_speeches(self):
+        """A response without a JSON array gives an empty result."""
+        client = FakeGeminiClient("Das kann ich leider nicht.")
+        evaluator = ParserEvaluator(client)
+
+        assert asyncio.run(evaluator.extract_batch([("1", "Text eins")])) == [[]]
+
+    def test_budget_splits_requests(self):
+        """Protocols exceeding the character budget are sent separately."""
+        client = FakeGeminiClient('[{"speaker": "Lars Klingbeil", "party": "SPD"}]')
+        evaluator = ParserEvaluator(client)
+
+        results = asyncio.run(
+            evaluator.extract_batch([("1", "a" * 20), ("2", "b" * 20)], max_batch_chars=30)
+        )
+
+        assert len(client.prompts) == 2
+        assert all(len(speeches) == 1 for speeches in results)
+
+    def test_missing_protocol_is_requested_alone(self):
+        """A protocol left out of the batch answer gets its own request."""
+        client = FakeGeminiClient(
+            '{"0": [{"speaker": "Alice Weidel", "party": "AfD"}]}',
+            '[{"speaker": "Lars Klingbeil", "party": "SPD"}]',
+        )
+        evaluator = ParserEvaluator(client)
+
+        results = asyncio.run(evaluator.extract_batch([("1", "Text eins"), ("2", "Text zwei")]))
+
+        assert len(client.prompts) == 2
+        assert "Text zwei" in client.prompts[1] and "Text eins" not in client.prompts[1]
+        assert [s.speaker for s in results[1]] == ["Lars Klingbeil"]
+
+    def test_batch_prompt_asks_for_section_numbers(self):
+        """The prompt keys replies by the number in the section headers."""
+        client = FakeGeminiClient(self.BATCH_RESPONSE)
+        evaluator = ParserEvaluator(client)
+
+        asyncio.run(evaluator.extract_batch([("21001", "Text eins"), ("21002", "Text zwei")]))
+
+        assert "=== PROTOCOL 0 ===" in client.prompts[0]
+        assert "=== PROTOCOL 1 ===" in client.prompts[0]
+        assert "numbers after PROTOCOL" in client.prompts[0]
+
+    @pytest.mark.parametrize("response, expected_requests", [
+        # Keyed by section number: one request covers both protocols
+        ('{"0": [{"speaker": "Alice Weidel", "party": "AfD"}], "1": []}', 1),
+        # Keyed by the real protocol ids: both are requested again alone
+        ('{"21001": [{"speaker": "Alice Weidel", "party": "AfD"}], "21002": []}', 3),
+    ])
+    def test_batch_reply_keys(self, response, expected_requests):
+        """Only replies keyed by section number are taken from the batch."""
+        client = FakeGeminiClient(response, '[{"speaker": "Alice Weidel", "party": "AfD"}]', "[]")
+        evaluator = ParserEvaluator(client)
+
+        results = asyncio.run(
+            evaluator.extract_batch([("21001", "Text eins"), ("21002", "Text zwei")])
+        )
+
+        assert len(client.prompts) == expected_requests
+        assert [s.speaker for s in results[0]] == ["Alice Weidel"]
+        assert results[1] == []
+
+    def test_duplicate_protocol_ids_are_kept_apart(self):
+        """Protocols sharing an id still get their own results."""
+        client = FakeGeminiClient(self.BATCH_RESPONSE)
+        evaluator = ParserEvaluator(client)
+
+        results = asyncio.run(
+            evaluator.extract_batch([("unknown", "Text eins"), ("unknown", "Text zwei")])
+        )
+
+        assert [s.speaker for s in results[0]] == ["Alice Weidel"]
+        assert results[1] == []
+
+    def test_batch_prompt_change_keeps_single_cache(self, tmp_path, monkeypatch):
+        """Entries cached from a single-protocol request survive batch prompt edits."""
+        client = FakeGeminiClient('[{"speaker": "Lars Klingbeil", "party": "SPD"}]')
+        evaluator = ParserEvaluator(client, cache_dir=tmp_path)
+        asyncio.run(evaluator.extract_batch([("1", "Text eins")]))
+
+        monkeypatch.setattr(parser_evaluation, "BATCH_EXTRACTION_PROMPT", "changed {protocols}")
+        results = asyncio.run(evaluator.extract_batch([("1", "Text eins")]))
+
+        assert len(client.prompts) == 1
+        assert [s.speaker for s in results[0]] == ["Lars Klingbeil"]
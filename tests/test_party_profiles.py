@@ -0,0 +1,66 @@
+"""Tests for rank-based party classification."""
+
+from noun_analysis.categorizer import ToneScores
+from noun_analysis.wrapped.party_profiles import (
+    TONE_CATEGORIES,
+    build_party_profile,
+    build_party_profiles,
+    compute_party_rankings,
+)
+
+
+ALL_PARTY_SCORES = {
+    "SPD": ToneScores(aggression_index=2.0, collaboration_score=70.0, solution_focus=65.0),
+    "AfD": ToneScores(aggression_index=9.0, demand_intensity=4.0, affirmative_score=30.0),
+    "GRÜNE": ToneScores(aggression_index=2.0, collaboration_score=60.0, affirmative_score=70.0),
+}
+
+
+class TestComputePartyRankings:
+    """Test per-category ranking of parties."""
+
+    def test_ranks_by_score_descending(self):
+        """The highest score gets rank 1 and scores are passed through."""
+        rankings = compute_party_rankings(ALL_PARTY_SCORES)
+
+        assert rankings["AfD"]["aggression"] == (1, 9.0)
+        assert rankings["SPD"]["collaboration"] == (1, 70.0)
+        assert rankings["GRÜNE"]["affirmative"] == (1, 70.0)
+        assert set(rankings["SPD"]) == set(TONE_CATEGORIES)
+
+    def test_ties_keep_party_order(self):
+        """Equal scores are ranked in the order parties were given."""
+        rankings = compute_party_rankings(ALL_PARTY_SCORES)
+
+        assert rankings["SPD"]["aggression"][0] == 2
+        assert rankings["GRÜNE"]["aggression"][0] == 3
+
+    def test_unknown_category_scores_zero(self):
+        """Categories without a score accessor rank every party at 0.0."""
+        rankings = compute_party_rankings(ALL_PARTY_SCORES, {"unknown": None})
+
+        assert [rankings[p]["unknown"] for p in ALL_PARTY_SCORES] == [(1, 0.0), (2, 0.0), (3, 0.0)]
+
+    def test_empty_input(self):
+        """No parties yield no rankings."""
+        assert compute_party_rankings({}) == {}
+
+
+class TestBuildPartyProfile:
+    """Test the assembled party profile."""
+
+    def test_category_is_best_ranked_trait(self):
+        """A party is classified by the tone category it leads."""
+        profile = build_party_profile("AfD", ALL_PARTY_SCORES["AfD"], ALL_PARTY_SCORES)
+
+        assert profile.category.id == "aggression"
+        assert (profile.rank, profile.score, profile.total_parties) == (1, 9.0, 3)
+        assert profile.traits[0] == "Aggressiv"
+
+    def test_batch_matches_single_profiles(self):
+        """Building all profiles at once gives the same per-party results."""
+        profiles = build_party_profiles(ALL_PARTY_SCORES)
+
+        assert list(profiles) == list(ALL_PARTY_SCORES)
+        for party, scores in ALL_PARTY_SCORES.items():
+            assert profiles[party] == build_party_profile(party, scores, ALL_PARTY_SCORES)
@@ -0,0 +1,130 @@
+"""Tests for the word frequency queries of WrappedData."""
+
+import pandas as pd
+
+from noun_analysis.wrapped.queries import WrappedDataQueries
+
+
+class FakeWrappedData(WrappedDataQueries):
+    """Just the attributes the word queries read."""
+
+    def __init__(self, frame):
+        self.word_frequencies = {"nouns": frame}
+        self.metadata = {"parties": ["SPD", "AfD"]}
+
+
+def make_frame(rows):
+    """Build a word frequency frame from (word, spd_count, afd_count) rows."""
+    frame = pd.DataFrame(rows, columns=["word", "SPD_count", "AfD_count"])
+    for party in ("SPD", "AfD"):
+        frame[f"{party}_per1000"] = frame[f"{party}_count"] / frame[f"{party}_count"].sum() * 1000
+    return frame
+
+
+FRAME = make_frame([
+    ("rente", 40, 2),
+    ("friedrich merz", 30, 1),
+    ("merz", 30, 1),
+    ("spd-fraktion", 50, 0),
+    ("migration", 5, 60),
+    ("bildung", 30, 1),
+    ("klima", 10, 0),
+])
+
+
+class TestGetKeyTopics:
+    """Test ranking and filtering of key topics."""
+
+    def test_ranked_by_count_with_ties_in_row_order(self):
+        """Most used words come first; equal counts keep their row order."""
+        data = FakeWrappedData(FRAME)
+
+        words = [word for word, _, _ in data.get_key_topics("SPD", top_n=3)]
+
+        assert words == ["rente", "friedrich merz", "bildung"]
+
+    def test_stopwords_and_substrings_are_dropped(self):
+        """Party self-references and shorter duplicates of names are skipped."""
+        data = FakeWrappedData(FRAME)
+
+        words = [word for word, _, _ in data.get_key_topics("SPD", top_n=10)]
+
+        assert "spd-fraktion" not in words
+        assert "merz" not in words
+        assert "migration" not in words
+
+    def test_missing_party(self):
+        """Parties without frequency columns have no key topics."""
+        assert FakeWrappedData(FRAME).get_key_topics("FDP") == []
+
+
+class TestGetDistinctiveWords:
+    """Test the balanced distinctiveness ranking."""
+
+    def test_top_n_limits_result(self):
+        """Only the top_n highest-scoring words are returned."""
+        data = FakeWrappedData(FRAME)
+
+        assert len(data.get_distinctive_words("SPD", top_n=2)) == 2
+        assert data.get_distinctive_words("SPD", top_n=0) == []
+
+    def test_distinctive_words_match_ratio_filter(self):
+        """Every returned word is used over twice as often as by others."""
+        data = FakeWrappedData(FRAME)
+
+        results = data.get_distinctive_words("AfD", top_n=5)
+
+        assert [word for word, _ in results] == ["migration"]
+        assert all(ratio > 2.0 for _, ratio in results)
+
+
+class TestGetExclusiveWords:
+    """Test words only one party uses."""
+
+    def test_exclusive_words_per_party(self):
+        """Words with zero uses by every other party, most used first."""
+        data = FakeWrappedData(FRAME)
+
+        result = data.get_exclusive_words(min_count=5, n=5)
+
+        assert result == {"SPD": [("spd-fraktion", 50), ("klima", 10)]}
+
+    def test_min_count_filters_rare_words(self):
+        """Exclusive words below min_count are left out."""
+        data = FakeWrappedData(FRAME)
+
+        assert data.get_exclusive_words(min_count=20, n=5) == {"SPD": [("spd-fraktion", 50)]}
+
+
+class TestSpeakerAggregates:
+    """Test the per-speaker word totals shared by the speaker rankings."""
+
+    SPEECHES = [
+        {"speaker": "A", "party": "SPD", "type": "befragung", "words": 900},
+        {"speaker": "B", "party": "AfD", "type": "rede", "words": 300},
+        {"speaker": "A", "party": "SPD", "type": "rede", "words": 100},
+        {"speaker": "A", "party": "fraktionslos", "type": "rede", "words": 200},
+    ]
+
+    def make_data(self):
+        data = FakeWrappedData(FRAME)
+        data.all_speeches = self.SPEECHES
+        return data
+
+    def test_wordiest_counts_all_speeches(self):
+        """Totals include every speech type; party is the latest one."""
+        assert self.make_data().get_wordiest_speakers() == [
+            ("A", "fraktionslos", 1200, 3),
+            ("B", "AfD", 300, 1),
+        ]
+
+    def test_avg_words_counts_only_reden(self):
+        """Only formal Reden count towards the average."""
+        assert self.make_data().get_speakers_by_avg_words(min_speeches=1) == [
+            ("B", "AfD", 300, 300, 1),
+            ("A", "fraktionslos", 150, 300, 2),
+        ]
+
+    def test_verbose_respects_min_speeches(self):
+        """Speakers below min_speeches are not ranked."""
+        assert self.make_data().get_verbose_speakers(min_speeches=2) == [("A", "fraktionslos", 400.0, 3)]
@@ -0,0 +1,65 @@
+"""Tests for per-party speech aggregation."""
+
+from collections import Counter
+
+from noun_analysis.speech_aggregation import aggregate_speeches_by_type
+
+
+SPEECHES = [
+    {'party': 'SPD', 'speaker': 'Lars Klingbeil', 'type': 'rede', 'category': 'rede'},
+    {'party': 'AfD', 'speaker': 'Alice Weidel', 'type': 'rede', 'category': 'rede'},
+    {'party': 'SPD', 'speaker': 'Lars Klingbeil', 'type': 'rede', 'category': 'rede'},
+    {'party': 'SPD', 'speaker': 'Bärbel Bas', 'type': 'befragung', 'category': 'wortbeitrag'},
+    {'party': 'AfD', 'speaker': 'Tino Chrupalla', 'type': 'fragestunde'},
+]
+
+
+class TestAggregateSpeechesByType:
+    """Test aggregate_speeches_by_type output structure and counts."""
+
+    def test_formal_speaker_counts(self):
+        """Only 'rede' speeches count towards speaker_stats."""
+        stats = aggregate_speeches_by_type(SPEECHES)
+
+        assert stats['speaker_stats'] == {
+            'SPD': Counter({'Lars Klingbeil': 2}),
+            'AfD': Counter({'Alice Weidel': 1}),
+        }
+        assert stats['formal_speaker_stats'] == stats['speaker_stats']
+        assert stats['real_speech_counts'] == {'SPD': 2, 'AfD': 1}
+
+    def test_question_and_answer_stats(self):
+        """Befragung answers and Fragestunde questions are tracked separately."""
+        stats = aggregate_speeches_by_type(SPEECHES)
+
+        assert stats['befragung_speaker_stats']['SPD'] == Counter({'Bärbel Bas': 1})
+        assert stats['question_speaker_stats']['AfD'] == Counter({'Tino Chrupalla': 1})
+
+    def test_missing_category_derived_from_type(self):
+        """Speeches without a category are counted as wortbeitrag unless type is 'rede'."""
+        stats = aggregate_speeches_by_type(SPEECHES)
+
+        assert stats['rede_counts'] == {'SPD': 2, 'AfD': 1}
+        assert stats['wortbeitrag_counts'] == {'SPD': 1, 'AfD': 1}
+        assert stats['wortbeitrag_speaker_stats']['AfD'] == Counter({'Tino Chrupalla': 1})
+
+    def test_parties_in_order_of_appearance(self):
+        """Every output dict lists parties in first-appearance order."""
+        stats = aggregate_speeches_by_type(SPEECHES)
+
+        for value in stats.values():
+            assert list(value) == ['SPD', 'AfD']
+
+    def test_empty_input(self):
+        """No speeches yield empty dicts."""
+        stats = aggregate_speeches_by_type([])
+
+        assert all(value == {} for value in stats.values())
+
+    def test_missing_party_kept_as_none(self):
+        """Speeches without a party are grouped under None, not NaN."""
+        stats = aggregate_speeches_by_type(
+            [{'party': None, 'speaker': 'Julia Klöckner', 'type': 'rede'}]
+        )
+
+        assert stats['speaker_stats'] == {None: Counter({'Julia Klöckner': 1})}